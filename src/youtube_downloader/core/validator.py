@@ -6,173 +6,229 @@ and normalize URLs to standard format.
 """
 
 import re
-from urllib.parse import urlparse, parse_qs
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlparse, parse_qs
 
 
-class URLValidator:
+# YouTube URL patterns
+YOUTUBE_DOMAINS = [
+    'youtube.com',
+    'www.youtube.com',
+    'm.youtube.com',
+    'youtu.be'
+]
+
+# Length bounds used to reject obviously invalid input before matching. The
+# upper bound also guards against pathological inputs.
+_MIN_URL_LENGTH = 17
+_MAX_URL_LENGTH = 2048
+
+# Regular expression for video ID validation
+VIDEO_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]{11}', re.ASCII)
+
+# Fast path covering the common shapes of every supported URL format. Compiled
+# at import so the first validation call does not pay the compile cost. The
+# video ID is captured by exactly one of the four groups. Everything it accepts
+# is also accepted by the urlparse rules in _match_parsed_url, which handle
+# whatever it misses. Query parameters before v= may not be another v=, contain
+# a percent escape or a tab/newline, so the first v value is the one taken.
+# The pattern is anchored with \A/\Z, uses fixed-width ID quantifiers and
+# '&'-delimited repetition, so matching stays linear even on adversarial input;
+# re.ASCII skips the Unicode character tables.
+_URL_REGEX = re.compile(r'''
+    \A(?i:https?://)
+    (?:
+        (?i:(?:www\.|m\.)?youtube\.com)/
+        (?:
+            watch(?:/[^?\#]*)?\?(?:(?!v=)[^&\#%\t\r\n]*&)*v=([a-zA-Z0-9_-]{11})(?=[&\#]|\Z)
+          | embed/([a-zA-Z0-9_-]{11})(?=[?\#]|\Z)
+          | shorts/([a-zA-Z0-9_-]{11})(?=[?\#]|\Z)
+        )
+      | (?i:youtu\.be)/([a-zA-Z0-9_-]{11})(?=[?\#]|\Z)
+    )
+''', re.VERBOSE | re.ASCII)
+
+
+def _is_plausible_url(url: str) -> bool:
     """
-    Validates and processes YouTube URLs.
+    Cheap pre-check that rejects strings which cannot be a YouTube URL.
     
-    Supports various YouTube URL formats including:
-    - https://www.youtube.com/watch?v=VIDEO_ID
-    - https://youtu.be/VIDEO_ID
-    - https://m.youtube.com/watch?v=VIDEO_ID
-    - https://youtube.com/watch?v=VIDEO_ID
+    Args:
+        url: URL to check
+        
+    Returns:
+        bool: False if URL can be rejected without running the regex
     """
+    if not _MIN_URL_LENGTH <= len(url) <= _MAX_URL_LENGTH:
+        return False
     
-    # YouTube URL patterns
-    YOUTUBE_DOMAINS = [
-        'youtube.com',
-        'www.youtube.com',
-        'm.youtube.com',
-        'youtu.be'
-    ]
-    
-    # Regular expression for video ID extraction
-    VIDEO_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]{11}')
+    # Host matching is case-insensitive; only lowercase when the fast check misses
+    return 'youtu' in url or 'youtu' in url.lower()
+
+
+def _match_parsed_url(url: str) -> Optional[str]:
+    """
+    Extract the video ID with urlparse for URLs outside the fast pattern.
     
-    def __init__(self):
-        """Initialize the URL validator."""
-        pass
+    Covers any scheme, scheme-relative URLs, percent-encoded query keys and
+    similar rarer shapes. urlparse also drops tabs and newlines, so a URL
+    pasted with a trailing newline, which the end anchor keeps out of the
+    fast path, is still accepted here.
     
-    def validate_youtube_url(self, url: Optional[str]) -> bool:
-        """
-        Validate if the given URL is a valid YouTube video URL.
-        
-        Args:
-            url: The URL to validate
-            
-        Returns:
-            bool: True if valid YouTube URL, False otherwise
-        """
-        if not url or not isinstance(url, str):
-            return False
+    Args:
+        url: URL to match
         
-        try:
-            parsed_url = urlparse(url)
-            
-            # Check if domain is YouTube
-            if not self._is_youtube_domain(parsed_url.netloc):
-                return False
-            
-            # Check URL format and extract video ID
-            video_id = self._extract_video_id_from_parsed_url(parsed_url)
-            
-            return video_id is not None and self._is_valid_video_id(video_id)
-        
-        except Exception:
-            return False
+    Returns:
+        Optional[str]: Video ID if URL matches a supported format, None otherwise
+    """
+    try:
+        parsed_url = urlparse(url)
+    except ValueError:
+        return None
     
-    def extract_video_id(self, url: str) -> str:
-        """
-        Extract video ID from YouTube URL.
-        
-        Args:
-            url: YouTube URL
-            
-        Returns:
-            str: Video ID
-            
-        Raises:
-            ValueError: If URL is invalid or video ID cannot be extracted
-        """
-        if not self.validate_youtube_url(url):
-            raise ValueError(f"Invalid YouTube URL: {url}")
+    netloc = parsed_url.netloc.lower()
+    path = parsed_url.path
+    
+    if netloc == 'youtu.be':
+        video_id = path.lstrip('/')
+        return video_id if is_valid_video_id(video_id) else None
+    
+    if netloc in ('youtube.com', 'www.youtube.com', 'm.youtube.com'):
+        if path == '/watch' or path.startswith('/watch/'):
+            values = parse_qs(parsed_url.query).get('v')
+            if values:
+                return values[0] if is_valid_video_id(values[0]) else None
         
-        try:
-            parsed_url = urlparse(url)
-            video_id = self._extract_video_id_from_parsed_url(parsed_url)
-            
-            if not video_id:
-                raise ValueError(f"Could not extract video ID from URL: {url}")
-            
-            return video_id
+        for prefix in ('/embed/', '/shorts/'):
+            if path.startswith(prefix):
+                video_id = path.split(prefix)[-1]
+                return video_id if is_valid_video_id(video_id) else None
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _extract_video_id_cached(url: str) -> Optional[str]:
+    """
+    Match URL against the supported formats and return the video ID.
+    
+    Results are memoized since the same URL is commonly validated several
+    times (GUI refreshes, download retries, batch jobs).
+    
+    Args:
+        url: URL to match
         
-        except Exception as e:
-            if isinstance(e, ValueError):
-                raise
-            raise ValueError(f"Error extracting video ID from URL: {url}")
+    Returns:
+        Optional[str]: Video ID if URL matches a supported format, None otherwise
+    """
+    match = _URL_REGEX.match(url)
+    if match is None:
+        return _match_parsed_url(url)
     
-    def normalize_url(self, url: str) -> str:
-        """
-        Normalize YouTube URL to standard format.
+    return match.group(match.lastindex)
+
+
+def validate_youtube_url(url: Optional[str]) -> bool:
+    """
+    Validate if the given URL is a valid YouTube video URL.
+    
+    Args:
+        url: The URL to validate
         
-        Args:
-            url: YouTube URL in any supported format
-            
-        Returns:
-            str: Normalized URL in format https://www.youtube.com/watch?v=VIDEO_ID
-            
-        Raises:
-            ValueError: If URL is invalid
-        """
-        video_id = self.extract_video_id(url)
-        return f"https://www.youtube.com/watch?v={video_id}"
-    
-    def _is_youtube_domain(self, netloc: str) -> bool:
-        """
-        Check if netloc is a YouTube domain.
+    Returns:
+        bool: True if valid YouTube URL, False otherwise
+    """
+    if not url or not isinstance(url, str) or not _is_plausible_url(url):
+        return False
+    
+    return _extract_video_id_cached(url) is not None
+
+
+def extract_video_id(url: str) -> str:
+    """
+    Extract video ID from YouTube URL.
+    
+    Args:
+        url: YouTube URL
         
-        Args:
-            netloc: Network location from parsed URL
-            
-        Returns:
-            bool: True if YouTube domain
-        """
-        return netloc.lower() in self.YOUTUBE_DOMAINS
-    
-    def _extract_video_id_from_parsed_url(self, parsed_url) -> Optional[str]:
-        """
-        Extract video ID from parsed URL object.
+    Returns:
+        str: Video ID
         
-        Args:
-            parsed_url: Parsed URL object
-            
-        Returns:
-            Optional[str]: Video ID if found, None otherwise
-        """
-        netloc = parsed_url.netloc.lower()
-        path = parsed_url.path
-        query = parsed_url.query
+    Raises:
+        ValueError: If URL is invalid or video ID cannot be extracted
+    """
+    if not url or not isinstance(url, str) or not _is_plausible_url(url):
+        raise ValueError(f"Invalid YouTube URL: {url}")
+    
+    video_id = _extract_video_id_cached(url)
+    if video_id is None:
+        raise ValueError(f"Invalid YouTube URL: {url}")
+    
+    return video_id
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize YouTube URL to standard format.
+    
+    Args:
+        url: YouTube URL in any supported format
         
-        # Handle youtu.be format
-        if netloc == 'youtu.be':
-            video_id = path.lstrip('/')
-            return video_id if self._is_valid_video_id(video_id) else None
+    Returns:
+        str: Normalized URL in format https://www.youtube.com/watch?v=VIDEO_ID
         
-        # Handle youtube.com formats
-        if netloc in ['youtube.com', 'www.youtube.com', 'm.youtube.com']:
-            # Check for /watch path with v parameter
-            if path == '/watch' or path.startswith('/watch/'):
-                query_params = parse_qs(query)
-                if 'v' in query_params and query_params['v']:
-                    video_id = query_params['v'][0]
-                    return video_id if self._is_valid_video_id(video_id) else None
-            
-            # Check for /embed/ path
-            if path.startswith('/embed/'):
-                video_id = path.split('/embed/')[-1].split('?')[0]
-                return video_id if self._is_valid_video_id(video_id) else None
-            
-            # Check for /shorts/ path (YouTube Shorts)
-            if path.startswith('/shorts/'):
-                video_id = path.split('/shorts/')[-1].split('?')[0]
-                return video_id if self._is_valid_video_id(video_id) else None
+    Raises:
+        ValueError: If URL is invalid
+    """
+    return f"https://www.youtube.com/watch?v={extract_video_id(url)}"
+
+
+def is_valid_video_id(video_id: str) -> bool:
+    """
+    Validate if string is a valid YouTube video ID.
+    
+    Args:
+        video_id: String to validate
         
-        return None
+    Returns:
+        bool: True if valid video ID format
+    """
+    if not video_id or len(video_id) != 11:
+        return False
+    
+    return bool(VIDEO_ID_PATTERN.fullmatch(video_id))
+
+
+class URLValidator:
+    """
+    Validates and processes YouTube URLs.
+    
+    Thin wrapper around the module-level functions, kept for backward
+    compatibility with code that instantiates a validator.
+    
+    Supports various YouTube URL formats including:
+    - https://www.youtube.com/watch?v=VIDEO_ID
+    - https://youtu.be/VIDEO_ID
+    - https://m.youtube.com/watch?v=VIDEO_ID
+    - https://youtube.com/watch?v=VIDEO_ID
+    """
+    
+    YOUTUBE_DOMAINS = YOUTUBE_DOMAINS
+    VIDEO_ID_PATTERN = VIDEO_ID_PATTERN
+    
+    def validate_youtube_url(self, url: Optional[str]) -> bool:
+        """Validate if the given URL is a valid YouTube video URL."""
+        return validate_youtube_url(url)
+    
+    def extract_video_id(self, url: str) -> str:
+        """Extract video ID from YouTube URL, raising ValueError if invalid."""
+        return extract_video_id(url)
+    
+    def normalize_url(self, url: str) -> str:
+        """Normalize YouTube URL to https://www.youtube.com/watch?v=VIDEO_ID."""
+        return normalize_url(url)
     
     def _is_valid_video_id(self, video_id: str) -> bool:
-        """
-        Validate if string is a valid YouTube video ID.
-        
-        Args:
-            video_id: String to validate
-            
-        Returns:
-            bool: True if valid video ID format
-        """
-        if not video_id or len(video_id) != 11:
-            return False
-        
-        return bool(self.VIDEO_ID_PATTERN.fullmatch(video_id))
\ No newline at end of file
+        """Validate if string is a valid YouTube video ID."""
+        return is_valid_video_id(video_id)
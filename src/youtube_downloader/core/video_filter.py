@@ -352,33 +352,41 @@ class VideoFilter:
             'upload_date_too_old': 0
         }
         
+        # Hoist config values and the parsed minimum date out of the loop
+        min_duration = self.filter_config.min_duration
+        max_duration = self.filter_config.max_duration
+        min_views = self.filter_config.min_view_count
+        min_date = None
+        if self.filter_config.min_upload_date:
+            try:
+                min_date = datetime.fromisoformat(self.filter_config.min_upload_date)
+            except ValueError:
+                pass  # Skip date counting if the configured date is invalid
+        
         for video in videos:
-            if video.is_short():
-                counts['shorts'] += 1
+            duration = video.duration
             
-            if video.is_live_stream():
+            # Live streams have duration=0 and are never counted as shorts
+            if duration == 0:
                 counts['live_streams'] += 1
+            elif duration < 60:
+                counts['shorts'] += 1
             
-            if (self.filter_config.min_duration and 
-                video.duration < self.filter_config.min_duration):
+            if min_duration and duration < min_duration:
                 counts['duration_too_short'] += 1
             
-            if (self.filter_config.max_duration and 
-                video.duration > self.filter_config.max_duration):
+            if max_duration and duration > max_duration:
                 counts['duration_too_long'] += 1
             
-            if (self.filter_config.min_view_count and 
-                video.view_count < self.filter_config.min_view_count):
+            if min_views and video.view_count < min_views:
                 counts['view_count_too_low'] += 1
             
             # Upload date filtering (with error handling)
-            if self.filter_config.min_upload_date:
+            if min_date is not None:
                 try:
-                    min_date = datetime.fromisoformat(self.filter_config.min_upload_date)
-                    video_date = datetime.fromisoformat(video.upload_date)
-                    if video_date < min_date:
+                    if datetime.fromisoformat(video.upload_date) < min_date:
                         counts['upload_date_too_old'] += 1
                 except ValueError:
                     pass  # Skip if date parsing fails
         
-        return counts 
\ No newline at end of file
+        return counts
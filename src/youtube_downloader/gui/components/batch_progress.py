@@ -9,6 +9,7 @@ import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
 from typing import List, Dict, Any, Callable, Optional
+import queue
 import threading
 from datetime import datetime
 from enum import Enum
@@ -26,12 +27,37 @@ class DownloadStatus(Enum):
     PAUSED = "paused"
 
 
+# Display text for each download status
+_STATUS_TEXT = {
+    DownloadStatus.PENDING: "⏳ Pending",
+    DownloadStatus.DOWNLOADING: "⬇️ Downloading",
+    DownloadStatus.COMPLETED: "✅ Completed",
+    DownloadStatus.FAILED: "❌ Failed",
+    DownloadStatus.CANCELLED: "🚫 Cancelled",
+    DownloadStatus.PAUSED: "⏸️ Paused"
+}
+
+# Statuses after which an item no longer changes
+_TERMINAL_STATUSES = frozenset({
+    DownloadStatus.COMPLETED,
+    DownloadStatus.FAILED,
+    DownloadStatus.CANCELLED
+})
+
+
 class BatchDownloadItem:
     """Data class for batch download item."""
     
+    __slots__ = (
+        "video_id", "title", "display_title", "url", "status", "progress",
+        "speed", "eta", "file_size", "downloaded_size", "error_message",
+        "start_time", "end_time"
+    )
+    
     def __init__(self, video_id: str, title: str, url: str):
         self.video_id = video_id
         self.title = title
+        self.display_title = title[:50] + "..." if len(title) > 50 else title
         self.url = url
         self.status = DownloadStatus.PENDING
         self.progress = 0.0  # 0-100
@@ -57,6 +83,10 @@ class BatchProgressPanel(ctk.CTkFrame):
     - Download statistics
     """
     
+    _TREE_COLUMNS = ("status", "title", "progress", "speed", "eta", "size")
+    # Inserting at least this many rows hides the tree until the batch is in
+    _BULK_INSERT_ROWS = 50
+    
     def __init__(self, parent, 
                  on_pause: Optional[Callable[[], None]] = None,
                  on_resume: Optional[Callable[[], None]] = None,
@@ -87,6 +117,40 @@ class BatchProgressPanel(ctk.CTkFrame):
         self.failed_videos = 0
         self.start_time: Optional[datetime] = None
         
+        # Indexes kept in sync with download_items so per-tick work is O(1)
+        self._items_by_id: Dict[str, BatchDownloadItem] = {}
+        self._downloading_items: Dict[str, BatchDownloadItem] = {}  # ordered set
+        self._failed_items: Dict[str, BatchDownloadItem] = {}  # ordered set
+        self._progress_sum = 0.0
+        self._terminal_count = 0
+        
+        # UI refresh throttling: progress callbacks only mutate item data and
+        # the widgets are redrawn at most once per interval
+        self._refresh_pending = False
+        self._refresh_interval_ms = 500
+        self._needs_refresh = False  # Set when a refresh was skipped while hidden
+        self._visible = False  # Tracks <Map>/<Unmap> of the panel itself
+        
+        # Last rendered values per tree row, used to only update changed cells
+        self._row_cache: Dict[str, tuple] = {}
+        
+        # Last rendered overall display; progress is quantized to whole percent
+        self._last_rendered_percent = 0
+        self._last_speed_eta = ""
+        
+        # Progress updates posted from download threads, drained on the Tk thread
+        self._progress_queue: queue.Queue = queue.Queue()
+        
+        # Elapsed time clock, ticking once per second while downloading
+        self._clock_job: Optional[str] = None
+        self._time_fmt = "%02d:%02d:%02d"
+        self._last_elapsed = -1
+        
+        # Theme values used by runtime state changes
+        self._c_accent = theme_manager.get_color("accent")
+        self._c_success = theme_manager.get_color("success")
+        self._c_text_secondary = theme_manager.get_color("text_secondary")
+        
         self._setup_ui()
         self._setup_bindings()
     
@@ -252,11 +316,9 @@ class BatchProgressPanel(ctk.CTkFrame):
                        font=theme_manager.get_font("body"))
         
         # Create treeview
-        columns = ("status", "title", "progress", "speed", "eta", "size")
-        
         self.progress_tree = ttk.Treeview(
             list_frame,
-            columns=columns,
+            columns=self._TREE_COLUMNS,
             show="headings",
             style="Progress.Treeview",
             height=8
@@ -349,6 +411,14 @@ class BatchProgressPanel(ctk.CTkFrame):
         """Set up event bindings."""
         # Double-click to show error details
         self.progress_tree.bind("<Double-1>", self._show_item_details)
+        
+        # Progress updates marshaled from worker threads. CTkFrame.bind targets
+        # the inner canvas, but the virtual event is generated on the frame itself.
+        tk.Frame.bind(self, "<<ProgressUpdate>>", self._drain_progress_queue)
+        
+        # Catch up on refreshes skipped while the panel was hidden
+        tk.Frame.bind(self, "<Map>", self._on_map)
+        tk.Frame.bind(self, "<Unmap>", self._on_unmap)
     
     def _show_panel(self, show: bool) -> None:
         """Show or hide the entire panel."""
@@ -366,6 +436,13 @@ class BatchProgressPanel(ctk.CTkFrame):
             self.progress_placeholder.grid_remove()
             self.progress_tree.grid(row=0, column=0, sticky="nsew")
     
+    def _set_if_changed(self, widget, **kwargs) -> None:
+        """Configure a widget with only the options whose values differ."""
+        changed = {key: value for key, value in kwargs.items()
+                   if widget.cget(key) != value}
+        if changed:
+            widget.configure(**changed)
+    
     def _toggle_pause_resume(self) -> None:
         """Toggle between pause and resume."""
         if self.is_paused:
@@ -378,31 +455,33 @@ class BatchProgressPanel(ctk.CTkFrame):
         if self.on_pause:
             self.on_pause()
         self.is_paused = True
-        self.pause_resume_btn.configure(text="▶️ Resume")
-        self.status_badge.configure(text="Paused", fg_color="#ffc107")
+        self._set_if_changed(self.pause_resume_btn, text="▶️ Resume")
+        self._set_if_changed(self.status_badge, text="Paused", fg_color="#ffc107")
     
     def _resume_download(self) -> None:
         """Resume download."""
         if self.on_resume:
             self.on_resume()
         self.is_paused = False
-        self.pause_resume_btn.configure(text="⏸️ Pause")
-        self.status_badge.configure(text="Downloading", fg_color=theme_manager.get_color("accent"))
+        self._set_if_changed(self.pause_resume_btn, text="⏸️ Pause")
+        self._set_if_changed(self.status_badge, text="Downloading", fg_color=self._c_accent)
     
     def _cancel_download(self) -> None:
         """Cancel download."""
         if self.on_cancel:
             self.on_cancel()
         self.is_downloading = False
+        self._cancel_clock()
         self.is_paused = False
-        self.pause_resume_btn.configure(state="disabled")
-        self.cancel_btn.configure(state="disabled")
-        self.status_badge.configure(text="Cancelled", fg_color="#dc3545")
+        self._set_if_changed(self.pause_resume_btn, state="disabled")
+        self._set_if_changed(self.cancel_btn, state="disabled")
+        self._set_if_changed(self.status_badge, text="Cancelled", fg_color="#dc3545")
     
     def _clear_completed(self) -> None:
         """Clear completed downloads from the list."""
         self.download_items = [item for item in self.download_items 
                               if item.status not in [DownloadStatus.COMPLETED, DownloadStatus.FAILED]]
+        self._rebuild_indexes()
         self._refresh_progress_list()
         self._update_statistics()
     
@@ -422,56 +501,90 @@ class BatchProgressPanel(ctk.CTkFrame):
                 pass
     
     def _refresh_progress_list(self) -> None:
-        """Refresh the progress list display."""
-        # Clear existing items
-        for item in self.progress_tree.get_children():
-            self.progress_tree.delete(item)
+        """Refresh the progress list display, updating only changed cells."""
+        tree = self.progress_tree
+        columns = self._TREE_COLUMNS
+        existing = set(tree.get_children())
+        row_cache = self._row_cache
+        
+        if len(self.download_items) - len(existing) >= self._BULK_INSERT_ROWS:
+            # Re-gridded by _show_progress_placeholder below
+            tree.grid_remove()
         
-        # Add current items
         for i, item in enumerate(self.download_items, 1):
+            iid = str(i)
             status_text = self._get_status_text(item.status)
-            progress_text = f"{item.progress:.1f}%" if item.progress > 0 else "0%"
-            
-            # Truncate title if too long
-            title_text = item.title[:50] + "..." if len(item.title) > 50 else item.title
+            # Whole percent so sub-percent ticks leave the cell unchanged
+            progress_text = f"{round(item.progress)}%"
             
-            self.progress_tree.insert("", "end", iid=str(i), values=(
+            values = (
                 status_text,
-                title_text,
+                item.display_title,
                 progress_text,
                 item.speed,
                 item.eta,
                 item.file_size
-            ))
+            )
+            
+            if iid not in existing:
+                tree.insert("", "end", iid=iid, values=values)
+            else:
+                existing.discard(iid)
+                old_values = row_cache[iid]
+                if old_values == values:
+                    continue
+                for column, old_value, new_value in zip(columns, old_values, values):
+                    if old_value != new_value:
+                        tree.set(iid, column, new_value)
+            
+            row_cache[iid] = values
+        
+        # Remove rows for items no longer in the list
+        for iid in existing:
+            tree.delete(iid)
+            row_cache.pop(iid, None)
         
         # Show/hide placeholder
         self._show_progress_placeholder(len(self.download_items) == 0)
     
     def _get_status_text(self, status: DownloadStatus) -> str:
         """Get display text for status."""
-        status_map = {
-            DownloadStatus.PENDING: "⏳ Pending",
-            DownloadStatus.DOWNLOADING: "⬇️ Downloading",
-            DownloadStatus.COMPLETED: "✅ Completed",
-            DownloadStatus.FAILED: "❌ Failed",
-            DownloadStatus.CANCELLED: "🚫 Cancelled",
-            DownloadStatus.PAUSED: "⏸️ Paused"
-        }
-        return status_map.get(status, "❓ Unknown")
+        return _STATUS_TEXT.get(status, "❓ Unknown")
     
     def _update_statistics(self) -> None:
         """Update statistics display."""
         self.total_stat.configure(text=str(self.total_videos))
         self.completed_stat.configure(text=str(self.completed_videos))
         self.failed_stat.configure(text=str(self.failed_videos))
-        
-        # Update elapsed time
+    
+    def _schedule_clock(self) -> None:
+        """Start the elapsed time clock."""
+        self._cancel_clock()
+        self._clock_job = self.after(1000, self._tick_clock)
+    
+    def _cancel_clock(self) -> None:
+        """Stop the elapsed time clock."""
+        if self._clock_job is not None:
+            self.after_cancel(self._clock_job)
+            self._clock_job = None
+    
+    def _tick_clock(self) -> None:
+        """Update the elapsed time and reschedule while downloading."""
+        self._clock_job = None
+        self._update_elapsed_time()
+        if self.is_downloading:
+            self._clock_job = self.after(1000, self._tick_clock)
+    
+    def _update_elapsed_time(self, now: Optional[datetime] = None) -> None:
+        """Update the elapsed time display when the whole second changes."""
         if self.start_time:
-            elapsed = datetime.now() - self.start_time
-            hours, remainder = divmod(elapsed.total_seconds(), 3600)
+            elapsed = int(((now or datetime.now()) - self.start_time).total_seconds())
+            if elapsed == self._last_elapsed:
+                return
+            self._last_elapsed = elapsed
+            hours, remainder = divmod(elapsed, 3600)
             minutes, seconds = divmod(remainder, 60)
-            time_str = f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
-            self.time_stat.configure(text=time_str)
+            self.time_stat.configure(text=self._time_fmt % (hours, minutes, seconds))
     
     def start_batch_download(self, video_items: List[Dict[str, Any]]) -> None:
         """Start a new batch download."""
@@ -484,6 +597,7 @@ class BatchProgressPanel(ctk.CTkFrame):
                 url=item_data.get('url', '')
             )
             self.download_items.append(download_item)
+        self._rebuild_indexes()
         
         # Reset state
         self.is_downloading = True
@@ -493,95 +607,187 @@ class BatchProgressPanel(ctk.CTkFrame):
         self.completed_videos = 0
         self.failed_videos = 0
         self.start_time = datetime.now()
+        self._last_elapsed = -1
         
         # Update UI
         self._show_panel(True)
         self.pause_resume_btn.configure(state="normal", text="⏸️ Pause")
         self.cancel_btn.configure(state="normal")
-        self.status_badge.configure(text="Downloading", fg_color=theme_manager.get_color("accent"))
+        self.status_badge.configure(text="Downloading", fg_color=self._c_accent)
         self.current_video_label.configure(text="Preparing downloads...")
         
         self._refresh_progress_list()
         self._update_statistics()
+        self._update_elapsed_time(self.start_time)
+        self._schedule_clock()
     
     def update_progress(self, video_id: str, progress_data: Dict[str, Any]) -> None:
-        """Update progress for a specific video."""
+        """
+        Update progress for a specific video.
+        
+        Safe to call from download threads: the update is queued and applied
+        on the Tk main loop via the <<ProgressUpdate>> virtual event.
+        """
+        self._progress_queue.put((video_id, progress_data))
+        self.event_generate("<<ProgressUpdate>>", when="tail")
+    
+    def _drain_progress_queue(self, event=None) -> None:
+        """Apply all queued progress updates and schedule one refresh."""
+        applied = False
+        now = datetime.now()
+        while True:
+            try:
+                video_id, progress_data = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._apply_progress(video_id, progress_data, now)
+            applied = True
+        
+        if applied:
+            # Redraw is coalesced; see _flush_ui
+            self._schedule_refresh()
+    
+    def _apply_progress(self, video_id: str, progress_data: Dict[str, Any],
+                        now: datetime) -> None:
+        """Apply a progress update to the item data (main thread only)."""
         # Find the download item
-        item = next((item for item in self.download_items if item.video_id == video_id), None)
+        item = self._items_by_id.get(video_id)
         if not item:
             return
         
-        # Update item data
-        item.progress = progress_data.get('progress', 0.0)
+        # Update item data and the running progress total
+        new_progress = progress_data.get('progress', 0.0)
+        self._progress_sum += new_progress - item.progress
+        item.progress = new_progress
+        self.overall_progress = self._progress_sum / len(self.download_items)
         item.speed = progress_data.get('speed', '')
         item.eta = progress_data.get('eta', '')
         item.file_size = progress_data.get('total_size', '')
         item.downloaded_size = progress_data.get('downloaded_size', '')
         
         # Update status
+        was_terminal = item.status in _TERMINAL_STATUSES
         if progress_data.get('status') == 'downloading':
             item.status = DownloadStatus.DOWNLOADING
             if not item.start_time:
-                item.start_time = datetime.now()
+                item.start_time = now
         elif progress_data.get('status') == 'completed':
             item.status = DownloadStatus.COMPLETED
-            item.end_time = datetime.now()
+            item.end_time = now
             self.completed_videos += 1
         elif progress_data.get('status') == 'failed':
             item.status = DownloadStatus.FAILED
             item.error_message = progress_data.get('error', 'Unknown error')
             self.failed_videos += 1
         
-        # Update current video display
         if item.status == DownloadStatus.DOWNLOADING:
-            self.current_video_label.configure(text=f"Downloading: {item.title}")
+            self._downloading_items[video_id] = item
+        else:
+            self._downloading_items.pop(video_id, None)
+        if item.status == DownloadStatus.FAILED:
+            self._failed_items[video_id] = item
+        else:
+            self._failed_items.pop(video_id, None)
         
-        # Update overall progress
-        total_progress = sum(item.progress for item in self.download_items)
-        self.overall_progress = total_progress / len(self.download_items) if self.download_items else 0
-        self.overall_progress_bar.set(self.overall_progress / 100)
+        is_terminal = item.status in _TERMINAL_STATUSES
+        if is_terminal != was_terminal:
+            self._terminal_count += 1 if is_terminal else -1
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild lookup indexes and the progress total from download_items."""
+        self._items_by_id = {item.video_id: item for item in self.download_items}
+        self._downloading_items = {item.video_id: item for item in self.download_items
+                                   if item.status == DownloadStatus.DOWNLOADING}
+        self._failed_items = {item.video_id: item for item in self.download_items
+                              if item.status == DownloadStatus.FAILED}
+        self._progress_sum = sum(item.progress for item in self.download_items)
+        self._terminal_count = sum(1 for item in self.download_items
+                                   if item.status in _TERMINAL_STATUSES)
+    
+    def _schedule_refresh(self) -> None:
+        """Schedule a single deferred UI refresh if none is pending."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after(self._refresh_interval_ms, self._flush_ui)
+    
+    def _flush_ui(self) -> None:
+        """Apply accumulated progress changes to the widgets."""
+        self._refresh_pending = False
         
-        # Update progress text
-        self.progress_text_label.configure(text=f"{self.overall_progress:.1f}%")
+        if self._visible:
+            self._needs_refresh = False
+            self._redraw_progress()
+        else:
+            self._needs_refresh = True
         
-        # Update speed and ETA (use current downloading item)
-        downloading_items = [item for item in self.download_items 
-                           if item.status == DownloadStatus.DOWNLOADING]
-        if downloading_items:
-            current_item = downloading_items[0]
+        # Check if all downloads are complete
+        if self.download_items and self._terminal_count == len(self.download_items):
+            self._on_batch_complete()
+    
+    def _on_map(self, event=None) -> None:
+        """Redraw once if progress arrived while the panel was hidden."""
+        self._visible = True
+        if self._needs_refresh:
+            self._needs_refresh = False
+            self._redraw_progress()
+    
+    def _on_unmap(self, event=None) -> None:
+        """Stop redrawing while the panel itself is hidden."""
+        self._visible = False
+    
+    def _redraw_progress(self) -> None:
+        """Redraw overall progress, the current item, the list and statistics."""
+        # Update overall progress bar and text only when the visible percent moves
+        pct = round(self.overall_progress)
+        if pct != self._last_rendered_percent:
+            self._last_rendered_percent = pct
+            self.overall_progress_bar.set(pct / 100)
+            self.progress_text_label.configure(text=f"{pct}%")
+        
+        # Update current video, speed and ETA (use current downloading item)
+        current_item = next(iter(self._downloading_items.values()), None)
+        if current_item:
+            self.current_video_label.configure(text=f"Downloading: {current_item.title}")
             speed_eta_text = f"{current_item.speed}"
             if current_item.eta:
                 speed_eta_text += f" • ETA: {current_item.eta}"
-            self.speed_eta_label.configure(text=speed_eta_text)
+            if speed_eta_text != self._last_speed_eta:
+                self._last_speed_eta = speed_eta_text
+                self.speed_eta_label.configure(text=speed_eta_text)
         
         # Refresh display
         self._refresh_progress_list()
         self._update_statistics()
-        
-        # Check if all downloads are complete
-        if all(item.status in [DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED] 
-               for item in self.download_items):
-            self._on_batch_complete()
     
     def _on_batch_complete(self) -> None:
         """Handle batch download completion."""
         self.is_downloading = False
         self.is_paused = False
-        self.pause_resume_btn.configure(state="disabled")
-        self.cancel_btn.configure(state="disabled")
+        self._cancel_clock()
+        self._update_elapsed_time()
+        self._set_if_changed(self.pause_resume_btn, state="disabled")
+        self._set_if_changed(self.cancel_btn, state="disabled")
+        
+        # Always draw the final state, even if the panel is hidden right now
+        if self._needs_refresh:
+            self._needs_refresh = False
+            self._redraw_progress()
         
         # Update status
         if self.failed_videos > 0:
-            self.status_badge.configure(text="Completed with errors", fg_color="#ffc107")
+            self._set_if_changed(self.status_badge, text="Completed with errors", fg_color="#ffc107")
         else:
-            self.status_badge.configure(text="Completed", fg_color=theme_manager.get_color("success"))
+            self._set_if_changed(self.status_badge, text="Completed", fg_color=self._c_success)
         
         self.current_video_label.configure(text="Batch download completed")
         self.speed_eta_label.configure(text="")
+        self._last_speed_eta = ""
     
     def reset(self) -> None:
         """Reset the progress panel."""
         self.download_items.clear()
+        self._rebuild_indexes()
         self.is_downloading = False
         self.is_paused = False
         self.overall_progress = 0.0
@@ -589,15 +795,18 @@ class BatchProgressPanel(ctk.CTkFrame):
         self.failed_videos = 0
         self.total_videos = 0
         self.start_time = None
+        self._cancel_clock()
         
         # Reset UI
         self.overall_progress_bar.set(0)
         self.progress_text_label.configure(text="0%")
         self.speed_eta_label.configure(text="")
+        self._last_rendered_percent = 0
+        self._last_speed_eta = ""
         self.current_video_label.configure(text="No active downloads")
-        self.status_badge.configure(text="Ready", fg_color=theme_manager.get_color("text_secondary"))
-        self.pause_resume_btn.configure(state="disabled", text="⏸️ Pause")
-        self.cancel_btn.configure(state="disabled")
+        self._set_if_changed(self.status_badge, text="Ready", fg_color=self._c_text_secondary)
+        self._set_if_changed(self.pause_resume_btn, state="disabled", text="⏸️ Pause")
+        self._set_if_changed(self.cancel_btn, state="disabled")
         
         self._refresh_progress_list()
         self._update_statistics()
@@ -613,5 +822,5 @@ class BatchProgressPanel(ctk.CTkFrame):
             'is_paused': self.is_paused,
             'overall_progress': self.overall_progress,
             'start_time': self.start_time,
-            'failed_items': [item for item in self.download_items if item.status == DownloadStatus.FAILED]
+            'failed_items': list(self._failed_items.values())
         } 
\ No newline at end of file
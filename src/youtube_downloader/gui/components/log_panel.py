@@ -6,22 +6,41 @@ Displays application logs with basic filtering and formatting.
 
 import customtkinter as ctk
 import tkinter as tk
+import queue
+from itertools import groupby
 from typing import List
 from datetime import datetime
 
 from ..styles.themes import theme_manager
 
 
+# Theme color for each log level's text tag ("level_<LEVEL>")
+_LEVEL_COLORS = {
+    "DEBUG": "text_secondary",
+    "INFO": "text_primary",
+    "WARNING": "warning",
+    "ERROR": "error",
+    "CRITICAL": "error"
+}
+
+
 class LogPanel(ctk.CTkFrame):
     """Simple log display panel."""
     
     def __init__(self, parent):
         super().__init__(parent)
         
-        self.log_entries = []
+        # Limits are in textbox lines; the textbox is the only log storage
         self.max_entries = 500
+        self.trim_entries = 100  # Lines dropped at once when the limit is hit
+        
+        # Entries are queued (thread-safe) and written to the textbox in batches
+        self._pending_logs: queue.Queue = queue.Queue()
+        self._flush_interval_ms = 100
+        self._flush_batch_size = 200
         
         self._setup_ui()
+        self._flush_job = self.after(self._flush_interval_ms, self._flush_logs)
     
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -59,31 +78,55 @@ class LogPanel(ctk.CTkFrame):
             wrap="word"
         )
         self.log_text.grid(row=1, column=0, sticky="nsew", padx=16, pady=(0, 16))
+        
+        # Lines are tagged by level so they can be colored and located via tag_ranges
+        for level, color_name in _LEVEL_COLORS.items():
+            self.log_text.tag_config(f"level_{level}", foreground=theme_manager.get_color(color_name))
     
     def add_log(self, level: str, message: str) -> None:
-        """Add a log entry."""
+        """Add a log entry. Safe to call from any thread."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_line = f"[{timestamp}] {level:8} | {message}\n"
         
-        self.log_text.insert("end", log_line)
-        self.log_text.see("end")
-        
-        # Keep only recent entries
-        if len(self.log_entries) >= self.max_entries:
-            self.log_entries = self.log_entries[100:]  # Remove oldest 100
-            self._refresh_display()
-        
-        self.log_entries.append({"timestamp": timestamp, "level": level, "message": message})
+        self._pending_logs.put((level, log_line))
     
     def clear_logs(self) -> None:
         """Clear all logs."""
+        self._drain_pending(self._pending_logs.qsize())
         self.log_text.delete("1.0", "end")
-        self.log_entries.clear()
         self.add_log("INFO", "Log history cleared")
     
-    def _refresh_display(self) -> None:
-        """Refresh the display."""
-        self.log_text.delete("1.0", "end")
-        for entry in self.log_entries:
-            log_line = f"[{entry['timestamp']}] {entry['level']:8} | {entry['message']}\n"
-            self.log_text.insert("end", log_line) 
\ No newline at end of file
+    def _drain_pending(self, limit: int) -> list:
+        """Pop up to limit queued (level, line) pairs."""
+        pending = []
+        while len(pending) < limit:
+            try:
+                pending.append(self._pending_logs.get_nowait())
+            except queue.Empty:
+                break
+        return pending
+    
+    def _flush_logs(self) -> None:
+        """Write queued entries to the textbox with a single insert."""
+        pending = self._drain_pending(self._flush_batch_size)
+        if pending:
+            # One insert per run of consecutive lines with the same level
+            for level, run in groupby(pending, key=lambda entry: entry[0]):
+                self.log_text.insert("end", "".join(line for _, line in run), f"level_{level}")
+            
+            # Keep only recent lines; trim the oldest in one call
+            line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+            overflow = line_count - self.max_entries
+            if overflow > 0:
+                self.log_text.delete("1.0", f"{max(overflow, self.trim_entries) + 1}.0")
+            
+            self.log_text.see("end")
+        
+        self._flush_job = self.after(self._flush_interval_ms, self._flush_logs)
+    
+    def destroy(self) -> None:
+        """Stop the flush loop and destroy the widget."""
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        super().destroy()
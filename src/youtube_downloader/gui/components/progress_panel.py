@@ -6,7 +6,9 @@ and estimated time remaining. Provides clear visual feedback to users.
 """
 
 import customtkinter as ctk
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
+from collections import deque
+import re
 import time
 
 from ..styles.themes import theme_manager
@@ -24,6 +26,25 @@ class ProgressPanel(ctk.CTkFrame):
     - File size information
     """
     
+    # Number before the "%" in yt-dlp's padded, possibly ANSI-colored _percent_str
+    _PERCENT_PATTERN = re.compile(r'(\d+(?:\.\d+)?)%')
+    
+    # Longer ETAs come from near-zero early speeds and are not shown
+    _MAX_ETA_SECONDS = 7 * 86400
+    
+    # Tk/CTk base classes still provide a __dict__; slots cover this panel's own state
+    __slots__ = (
+        'start_time', 'bytes_downloaded', 'total_bytes', 'current_status',
+        'title_label', 'progress_bar', 'percentage_label', 'status_label',
+        'speed_label', 'size_label', 'eta_label',
+        '_total_bytes_str', '_speed_samples', '_speed_window',
+        '_last_ui_update', '_min_interval', '_pending', '_pending_job',
+        '_displayed', '_display_labels', '_pending_ops', '_flush_scheduled',
+        '_bar_mode', '_last_status', '_download_labels_built', '_download_labels_visible',
+        '_status_colors_info', '_status_colors_success', '_status_colors_warning',
+        '_status_colors_error'
+    )
+    
     def __init__(self, parent):
         """Initialize progress panel."""
         super().__init__(parent)
@@ -32,113 +53,167 @@ class ProgressPanel(ctk.CTkFrame):
         self.bytes_downloaded = 0
         self.total_bytes = 0
         self.current_status = "idle"
+        self._total_bytes_str = ""  # Formatted total_bytes, set when it changes
+        
+        # Recent (monotonic time, bytes downloaded) samples for a smoothed ETA
+        self._speed_samples: deque = deque(maxlen=32)
+        self._speed_window = 3.0
+        
+        # Download updates are applied at most once per interval; the newest
+        # skipped update is applied by a trailing flush
+        self._last_ui_update = 0.0
+        self._min_interval = 0.1
+        self._pending: Optional[Dict[str, Any]] = None
+        self._pending_job: Optional[str] = None
+        
+        # Values currently shown, so unchanged ones are not reconfigured
+        self._displayed: Dict[str, Any] = {
+            'bar': -1.0, 'pct': '', 'speed': '', 'size': '', 'eta': ''
+        }
+        
+        # Widget changes are collected per widget and applied in one idle pass
+        self._pending_ops: Dict[Any, Dict[str, Any]] = {}
+        self._flush_scheduled = False
+        self._bar_mode = "determinate"
+        self._last_status = (None, None)  # (message, status_type) last shown
+        
+        # Speed/size/ETA labels are created on the first download and hidden when idle
+        self.speed_label: Optional[ctk.CTkLabel] = None
+        self.size_label: Optional[ctk.CTkLabel] = None
+        self.eta_label: Optional[ctk.CTkLabel] = None
+        self._download_labels_built = False
+        self._download_labels_visible = False
         
         self._setup_ui()
         self.reset()
     
     def _setup_ui(self) -> None:
         """Set up the user interface."""
-        self.grid_columnconfigure(1, weight=1)
+        # Widgets sit directly on the panel: bar and status span columns 0-2,
+        # the percentage is in column 3 and speed/size/ETA use one column each
+        self.grid_columnconfigure((0, 1, 2), weight=1)
+        self.grid_rowconfigure(3, minsize=12)  # Bottom padding while row 3 is hidden
+        self.refresh_theme()
+        
+        # Theme values shared by the widgets below
+        font_subheading = theme_manager.get_font("subheading")
+        font_body = theme_manager.get_font("body")
+        font_small = theme_manager.get_font("small")
+        text_primary = theme_manager.get_color("text_primary")
+        text_secondary = self._status_colors_info
         
         # Title
         self.title_label = ctk.CTkLabel(
             self,
             text="Download Progress",
-            font=theme_manager.get_font("subheading"),
-            text_color=theme_manager.get_color("text_primary")
+            font=font_subheading,
+            text_color=text_primary
         )
         self.title_label.grid(
-            row=0, column=0, columnspan=2,
+            row=0, column=0, columnspan=4,
             sticky="w", padx=16, pady=(16, 8)
         )
         
-        # Progress frame
-        progress_frame = ctk.CTkFrame(self)
-        progress_frame.grid(
-            row=1, column=0, columnspan=2,
-            sticky="ew", padx=16, pady=(0, 8)
-        )
-        progress_frame.grid_columnconfigure(0, weight=1)
-        
         # Progress bar
         self.progress_bar = ctk.CTkProgressBar(
-            progress_frame,
+            self,
             height=20,
             corner_radius=10
         )
         self.progress_bar.grid(
-            row=0, column=0,
-            sticky="ew", padx=16, pady=(16, 8)
+            row=1, column=0, columnspan=3,
+            sticky="ew", padx=(16, 0), pady=(0, 8)
         )
         self.progress_bar.set(0)
         
         # Progress percentage
         self.percentage_label = ctk.CTkLabel(
-            progress_frame,
+            self,
             text="0%",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=font_body,
+            text_color=text_primary
         )
         self.percentage_label.grid(
-            row=0, column=1,
-            padx=(8, 16), pady=(16, 8)
+            row=1, column=3,
+            padx=(8, 16), pady=(0, 8)
         )
         
-        # Status information frame
-        status_frame = ctk.CTkFrame(progress_frame, fg_color="transparent")
-        status_frame.grid(
-            row=1, column=0, columnspan=2,
-            sticky="ew", padx=16, pady=(0, 16)
-        )
-        status_frame.grid_columnconfigure((0, 1, 2), weight=1)
-        
         # Status message
         self.status_label = ctk.CTkLabel(
-            status_frame,
+            self,
             text="Ready to download",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=font_small,
+            text_color=text_secondary
         )
         self.status_label.grid(
-            row=0, column=0, columnspan=3,
-            sticky="w", pady=(0, 4)
+            row=2, column=0, columnspan=4,
+            sticky="w", padx=16, pady=(0, 4)
         )
         
+        # Labels updated through _apply, by display key
+        self._display_labels = {'pct': self.percentage_label}
+    
+    def _show_download_labels(self) -> None:
+        """Show the speed/size/ETA labels, creating them on first use."""
+        if self._download_labels_built:
+            if not self._download_labels_visible:
+                self.speed_label.grid()
+                self.size_label.grid()
+                self.eta_label.grid()
+                self._download_labels_visible = True
+            return
+        
+        font_small = theme_manager.get_font("small")
+        text_secondary = self._status_colors_info
+        
         # Download speed
         self.speed_label = ctk.CTkLabel(
-            status_frame,
+            self,
             text="Speed: --",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=font_small,
+            text_color=text_secondary
         )
         self.speed_label.grid(
-            row=1, column=0,
-            sticky="w"
+            row=3, column=0,
+            sticky="w", padx=(16, 0), pady=(0, 16)
         )
         
         # Downloaded/Total size
         self.size_label = ctk.CTkLabel(
-            status_frame,
+            self,
             text="Size: --",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=font_small,
+            text_color=text_secondary
         )
         self.size_label.grid(
-            row=1, column=1,
-            sticky="w"
+            row=3, column=1,
+            sticky="w", pady=(0, 16)
         )
         
         # ETA
         self.eta_label = ctk.CTkLabel(
-            status_frame,
+            self,
             text="ETA: --",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=font_small,
+            text_color=text_secondary
         )
         self.eta_label.grid(
-            row=1, column=2,
-            sticky="w"
+            row=3, column=2,
+            sticky="w", pady=(0, 16)
         )
+        
+        self._display_labels.update(speed=self.speed_label, size=self.size_label, eta=self.eta_label)
+        self._displayed.update(speed="Speed: --", size="Size: --", eta="ETA: --")
+        self._download_labels_built = True
+        self._download_labels_visible = True
+    
+    def _hide_download_labels(self) -> None:
+        """Hide the speed/size/ETA labels while idle."""
+        if self._download_labels_visible:
+            self.speed_label.grid_remove()
+            self.size_label.grid_remove()
+            self.eta_label.grid_remove()
+            self._download_labels_visible = False
     
     def update_progress(self, progress_data: Dict[str, Any]) -> None:
         """
@@ -149,6 +224,18 @@ class ProgressPanel(ctk.CTkFrame):
         """
         status = progress_data.get('status', 'unknown')
         
+        if status == 'downloading':
+            now = time.monotonic()
+            if now - self._last_ui_update < self._min_interval:
+                self._pending = progress_data
+                if self._pending_job is None:
+                    self._pending_job = self.after(int(self._min_interval * 1000), self._flush_pending)
+                return
+            self._last_ui_update = now
+            self._pending = None
+        else:
+            self._cancel_pending()
+        
         if status == 'downloading':
             self._update_downloading(progress_data)
         elif status == 'finished':
@@ -158,45 +245,97 @@ class ProgressPanel(ctk.CTkFrame):
         else:
             self._update_status(f"Status: {status}")
     
+    def bulk_update(self, progress_items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Apply a batch of queued progress updates at once.
+        
+        Only the newest update of each status is shown, since earlier ones
+        would be overwritten immediately.
+        
+        Args:
+            progress_items: Progress dictionaries in the order they were received
+        """
+        latest = finished = error = None
+        for progress_data in progress_items:
+            status = progress_data.get('status')
+            if status == 'downloading':
+                latest = progress_data
+            elif status == 'finished':
+                finished = progress_data
+            elif status == 'error':
+                error = progress_data
+        
+        self._cancel_pending()
+        if latest is not None:
+            self._last_ui_update = time.monotonic()
+            self._update_downloading(latest)
+        if finished is not None:
+            self._update_finished(finished)
+        if error is not None:
+            self._update_error(error)
+    
+    def _flush_pending(self) -> None:
+        """Apply the newest throttled download update."""
+        self._pending_job = None
+        if self._pending is not None:
+            data, self._pending = self._pending, None
+            self._last_ui_update = time.monotonic()
+            self._update_downloading(data)
+    
+    def _cancel_pending(self) -> None:
+        """Drop any throttled download update."""
+        self._pending = None
+        if self._pending_job is not None:
+            self.after_cancel(self._pending_job)
+            self._pending_job = None
+    
     def _update_downloading(self, data: Dict[str, Any]) -> None:
         """Update display during download."""
         if self.start_time is None:
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
+        self._show_download_labels()
+        
+        new: Dict[str, Any] = {}
         
         # Update progress bar
         if 'total_bytes' in data and data['total_bytes']:
-            self.total_bytes = data['total_bytes']
+            if data['total_bytes'] != self.total_bytes:
+                self.total_bytes = data['total_bytes']
+                self._total_bytes_str = self._format_bytes(self.total_bytes)
             self.bytes_downloaded = data.get('downloaded_bytes', 0)
-            progress = self.bytes_downloaded / self.total_bytes
-            self.progress_bar.set(progress)
-            self.percentage_label.configure(text=f"{progress * 100:.1f}%")
+            self._add_speed_sample(self.bytes_downloaded)
+            # Quantize to the 0.1% display resolution so _apply skips
+            # updates that would not visibly change the bar or label
+            tenths = int(self.bytes_downloaded * 1000 // self.total_bytes)
+            new['bar'] = tenths * 0.001
+            new['pct'] = f"{tenths / 10:.1f}%"
         elif '_percent_str' in data:
             # Fallback to yt-dlp's percentage string
-            percent_str = data['_percent_str'].strip()
-            self.percentage_label.configure(text=percent_str)
-            try:
-                percent_value = float(percent_str.replace('%', '')) / 100
-                self.progress_bar.set(percent_value)
-            except ValueError:
-                pass
+            match = self._PERCENT_PATTERN.search(data['_percent_str'])
+            if match:
+                percent = float(match.group(1))
+                new['bar'] = percent * 0.01
+                new['pct'] = f"{percent:.1f}%"
         
         # Update speed
         speed = data.get('speed')
         if speed:
             speed_str = self._format_speed(speed)
-            self.speed_label.configure(text=f"Speed: {speed_str}")
+            new['speed'] = f"Speed: {speed_str}"
         
         # Update size information
         if self.total_bytes > 0:
-            size_str = f"{self._format_bytes(self.bytes_downloaded)} / {self._format_bytes(self.total_bytes)}"
-            self.size_label.configure(text=f"Size: {size_str}")
+            size_str = f"{self._format_bytes(self.bytes_downloaded)} / {self._total_bytes_str}"
+            new['size'] = f"Size: {size_str}"
         
-        # Update ETA
-        if self.bytes_downloaded > 0 and self.total_bytes > 0 and speed:
+        # Update ETA, keeping the previous one when this tick's is nonsensical
+        if self.bytes_downloaded > 0 and self.total_bytes > 0 and speed and speed > 1:
             remaining_bytes = self.total_bytes - self.bytes_downloaded
-            eta_seconds = remaining_bytes / speed
-            eta_str = self._format_time(eta_seconds)
-            self.eta_label.configure(text=f"ETA: {eta_str}")
+            eta_seconds = remaining_bytes / self._window_speed(speed)
+            if 0 <= eta_seconds <= self._MAX_ETA_SECONDS:
+                new['eta'] = f"ETA: {self._format_time(eta_seconds)}"
+        
+        self._apply(new)
         
         # Update status
         filename = data.get('filename', '')
@@ -205,19 +344,40 @@ class ProgressPanel(ctk.CTkFrame):
         else:
             self._update_status("Downloading...")
     
+    def _add_speed_sample(self, bytes_downloaded: int) -> None:
+        """Record a download sample and drop those outside the speed window."""
+        samples = self._speed_samples
+        if samples and bytes_downloaded < samples[-1][1]:
+            # A new file (e.g. the audio stream) started
+            samples.clear()
+        now = time.monotonic()
+        samples.append((now, bytes_downloaded))
+        while now - samples[0][0] > self._speed_window:
+            samples.popleft()
+    
+    def _window_speed(self, fallback: float) -> float:
+        """Average speed over the recent samples, or fallback if too few."""
+        samples = self._speed_samples
+        if len(samples) >= 2:
+            elapsed = samples[-1][0] - samples[0][0]
+            if elapsed >= 0.5:
+                window_speed = (samples[-1][1] - samples[0][1]) / elapsed
+                if window_speed > 0:
+                    return window_speed
+        return fallback
+    
     def _update_finished(self, data: Dict[str, Any]) -> None:
         """Update display when download is finished."""
-        self.progress_bar.set(1.0)
-        self.percentage_label.configure(text="100%")
+        self._apply({'bar': 1.0, 'pct': "100%"})
         
         filename = data.get('filename', 'file')
         self._update_status(f"✓ Download completed: {filename}", "success")
         
         # Calculate total time
         if self.start_time:
-            total_time = time.time() - self.start_time
+            total_time = time.monotonic() - self.start_time
             time_str = self._format_time(total_time)
-            self.eta_label.configure(text=f"Completed in: {time_str}")
+            self._apply({'eta': f"Completed in: {time_str}"})
     
     def _update_error(self, data: Dict[str, Any]) -> None:
         """Update display when an error occurs."""
@@ -228,59 +388,120 @@ class ProgressPanel(ctk.CTkFrame):
         """Update status message with appropriate styling."""
         self.current_status = status_type
         
-        # Set color based on status type
-        color_map = {
-            "info": theme_manager.get_color("text_secondary"),
-            "success": theme_manager.get_color("success"),
-            "warning": theme_manager.get_color("warning"),
-            "error": theme_manager.get_color("error")
-        }
+        # Most download ticks repeat the same message
+        key = (message, status_type)
+        if key == self._last_status:
+            return
+        self._last_status = key
         
-        color = color_map.get(status_type, theme_manager.get_color("text_secondary"))
-        self.status_label.configure(text=message, text_color=color)
+        # Set color based on status type
+        if status_type == "success":
+            color = self._status_colors_success
+        elif status_type == "error":
+            color = self._status_colors_error
+        elif status_type == "warning":
+            color = self._status_colors_warning
+        else:
+            color = self._status_colors_info
+        self._enqueue(self.status_label, text=message, text_color=color)
+    
+    def refresh_theme(self) -> None:
+        """Reload status colors from the current theme."""
+        self._last_status = (None, None)
+        self._status_colors_info = theme_manager.get_color("text_secondary")
+        self._status_colors_success = theme_manager.get_color("success")
+        self._status_colors_warning = theme_manager.get_color("warning")
+        self._status_colors_error = theme_manager.get_color("error")
     
     def set_preparing(self, message: str = "Preparing download...") -> None:
         """Set preparing state."""
         self._update_status(message, "info")
-        self.progress_bar.set(0)
-        self.percentage_label.configure(text="0%")
+        self._apply({'bar': 0, 'pct': "0%"})
     
     def set_fetching_info(self, message: str = "Fetching video information...") -> None:
         """Set info fetching state."""
         self._update_status(message, "info")
         # Use indeterminate progress
-        self.progress_bar.configure(mode="indeterminate")
-        self.progress_bar.start()
-        self.percentage_label.configure(text="...")
+        self._set_bar_mode("indeterminate")
+        self._displayed['bar'] = -1.0  # Bar value is now driven by the animation
+        self._apply({'pct': "..."})
     
     def set_ready(self, message: str = "Ready to download") -> None:
         """Set ready state."""
-        self.progress_bar.stop()
-        self.progress_bar.configure(mode="determinate")
+        self._set_bar_mode("determinate")
         self._update_status(message, "info")
         self.reset()
     
+    def _set_bar_mode(self, mode: str) -> None:
+        """Switch the progress bar mode, starting or stopping its animation."""
+        if mode == self._bar_mode:
+            return
+        self._bar_mode = mode
+        if mode == "indeterminate":
+            self.progress_bar.configure(mode=mode)
+            self.progress_bar.start()
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode=mode)
+    
     def reset(self) -> None:
         """Reset progress display to initial state."""
+        self._cancel_pending()
         self.start_time = None
         self.bytes_downloaded = 0
         self.total_bytes = 0
+        self._total_bytes_str = ""
+        self._speed_samples.clear()
+        self._last_status = (None, None)
         self.current_status = "idle"
         
-        self.progress_bar.set(0)
-        self.percentage_label.configure(text="0%")
-        self.speed_label.configure(text="Speed: --")
-        self.size_label.configure(text="Size: --")
-        self.eta_label.configure(text="ETA: --")
+        values = {'bar': 0, 'pct': "0%"}
+        if self._download_labels_built:
+            values.update(speed="Speed: --", size="Size: --", eta="ETA: --")
+            self._hide_download_labels()
+        self._apply(values)
         self._update_status("Ready to download")
     
+    def _apply(self, values: Dict[str, Any]) -> None:
+        """Show display values, skipping those that are already shown."""
+        displayed = self._displayed
+        for key, value in values.items():
+            if displayed[key] == value:
+                continue
+            displayed[key] = value
+            if key == 'bar':
+                self._enqueue(self.progress_bar, value=value)
+            else:
+                self._enqueue(self._display_labels[key], text=value)
+    
+    def _enqueue(self, widget, **options) -> None:
+        """Queue widget options; later values for the same option win."""
+        self._pending_ops.setdefault(widget, {}).update(options)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_ops)
+    
+    def _flush_ops(self) -> None:
+        """Apply queued widget options with one call per widget."""
+        self._flush_scheduled = False
+        ops, self._pending_ops = self._pending_ops, {}
+        for widget, options in ops.items():
+            if widget is self.progress_bar:
+                widget.set(options['value'])
+            else:
+                widget.configure(**options)
+    
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes into human-readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_value < 1024:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024
-        return f"{bytes_value:.1f} TB"
+        if bytes_value < 1024:
+            return f"{bytes_value:.1f} B"
+        if bytes_value < 1048576:
+            return f"{bytes_value / 1024:.1f} KB"
+        if bytes_value < 1073741824:
+            return f"{bytes_value / 1048576:.1f} MB"
+        if bytes_value < 1099511627776:
+            return f"{bytes_value / 1073741824:.1f} GB"
+        return f"{bytes_value / 1099511627776:.1f} TB"
     
     def _format_speed(self, speed: float) -> str:
         """Format download speed into human-readable string."""
@@ -288,13 +509,11 @@ class ProgressPanel(ctk.CTkFrame):
     
     def _format_time(self, seconds: float) -> str:
         """Format time into human-readable string."""
+        seconds = int(seconds)
         if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
+            return f"{seconds}s"
+        if seconds < 3600:
+            minutes, secs = divmod(seconds, 60)
             return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m" 
\ No newline at end of file
+        hours, remainder = divmod(seconds, 3600)
+        return f"{hours}h {remainder // 60}m" 
\ No newline at end of file
@@ -5,22 +5,107 @@ Displays YouTube search results in a table format with selection controls
 and batch operation capabilities for the YouTube downloader.
 """
 
+import functools
+import re
 import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
 from typing import List, Dict, Any, Callable, Optional, Set
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from PIL import Image, ImageTk
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 import webbrowser
 
+try:
+    import pyvips  # Optional, decodes thumbnails faster than PIL
+except (ImportError, OSError):
+    pyvips = None
+
 from ..styles.themes import theme_manager
 
 
+# Matches YouTube thumbnail URLs, capturing the video id
+_YTIMG_PATTERN = re.compile(r'^https?://i\d*\.ytimg\.com/vi(?:_webp)?/([^/]+)/')
+
+# Select column text, indexed by VideoResultItem.selected. Plain text glyphs:
+# an emoji presentation selector would make Tk fall back to an emoji font
+_SELECT_GLYPHS = ("☐", "☑")
+
+# View count suffixes, largest first
+_NUMBER_SUFFIXES = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+# Inserts a batch of rows in one Tcl call. Each row is a list of
+# "treeview insert" arguments passed as data, never substituted as script
+_INSERT_ROWS_PROC = "proc ::_rl_insert_rows {tree rows} {foreach row $rows {$tree insert {*}$row}}"
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text longer than limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Shared by the thumbnail workers so connections to the image host are reused
+_thumb_session = requests.Session()
+_thumb_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1))
+
+# Theme the shared treeview style was last configured for
+_styled_theme: Optional[str] = None
+
+
+def _configure_style_once(row_height: int) -> None:
+    """Configure the shared treeview style, once per application theme."""
+    global _styled_theme
+    if _styled_theme == theme_manager.theme_name:
+        return
+    _styled_theme = theme_manager.theme_name
+    
+    style = ttk.Style()
+    style.theme_use("clam")
+    
+    # Configure treeview colors to match CustomTkinter theme
+    style.configure("Custom.Treeview",
+                   background=theme_manager.get_color("bg_secondary"),
+                   foreground=theme_manager.get_color("text_primary"),
+                   fieldbackground=theme_manager.get_color("bg_secondary"),
+                   borderwidth=0,
+                   rowheight=row_height,
+                   font=theme_manager.get_font("small"))
+    
+    style.configure("Custom.Treeview.Heading",
+                   background=theme_manager.get_color("accent"),
+                   foreground="white",
+                   font=theme_manager.get_font("body"),
+                   borderwidth=1,
+                   relief="solid")
+
+
+def _decode_thumbnail(data: bytes, width: int, height: int) -> Image.Image:
+    """Decode image bytes into an RGB image fitting within width x height."""
+    if pyvips is not None:
+        thumb = pyvips.Image.thumbnail_buffer(data, width, height=height)
+        if thumb.hasalpha():
+            thumb = thumb.flatten()
+        if thumb.bands != 3:
+            thumb = thumb.colourspace("srgb")
+        return Image.frombytes("RGB", (thumb.width, thumb.height), thumb.write_to_memory())
+    
+    image = Image.open(BytesIO(data))
+    image.thumbnail((width, height), Image.Resampling.LANCZOS)
+    return image
+
+
 class VideoResultItem:
     """Data class for video search result item."""
     
+    __slots__ = (
+        "video_id", "title", "duration", "uploader", "upload_date", "view_count",
+        "thumbnail_url_hires", "thumbnail_url", "url", "selected", "thumbnail_image",
+    )
+    
     def __init__(self, data: Dict[str, Any]):
         self.video_id: str = data.get('video_id', '')
         self.title: str = data.get('title', 'Unknown Title')
@@ -28,7 +113,12 @@ class VideoResultItem:
         self.uploader: str = data.get('uploader', 'Unknown')
         self.upload_date: str = data.get('upload_date', '')
         self.view_count: int = data.get('view_count', 0)
-        self.thumbnail_url: str = data.get('thumbnail_url', '')
+        self.thumbnail_url_hires: str = data.get('thumbnail_url', '')
+        self.thumbnail_url: str = self.thumbnail_url_hires
+        match = _YTIMG_PATTERN.match(self.thumbnail_url_hires)
+        if match:
+            # The list only needs the 320x180 variant
+            self.thumbnail_url = f'https://i.ytimg.com/vi/{match.group(1)}/mqdefault.jpg'
         self.url: str = data.get('url', f'https://www.youtube.com/watch?v={self.video_id}')
         self.selected: bool = False
         self.thumbnail_image: Optional[ImageTk.PhotoImage] = None
@@ -47,6 +137,13 @@ class ResultList(ctk.CTkFrame):
     - Download selected videos functionality
     """
     
+    # Thumbnails kept in memory, least recently used evicted first
+    _THUMBNAIL_CACHE_SIZE = 256
+    # Thumbnails are downscaled to the row size before caching
+    _THUMBNAIL_SIZE = (64, 36)
+    # Results whose thumbnails are fetched ahead of scrolling
+    _THUMBNAIL_PREFETCH = 48
+    
     def __init__(self, parent, on_download_selected: Optional[Callable[[List[VideoResultItem]], None]] = None):
         """
         Initialize result list.
@@ -59,11 +156,33 @@ class ResultList(ctk.CTkFrame):
         
         self.on_download_selected = on_download_selected
         self.results: List[VideoResultItem] = []
+        self._by_id: Dict[str, VideoResultItem] = {}  # tree item id (video_id) -> result
+        self._row_cache: List[tuple] = []  # formatted columns after "select", per result
         self.selected_items: Set[str] = set()  # video_ids
-        self.thumbnail_cache: Dict[str, ImageTk.PhotoImage] = {}
+        self.thumbnail_cache: "OrderedDict[str, ImageTk.PhotoImage]" = OrderedDict()
+        
+        # Thumbnails are downloaded and decoded off the Tk thread
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="thumbnail")
+        self._thumb_pending: Dict[str, Future] = {}  # video_id -> queued or running fetch
+        # Bumped when the result set is replaced; older fetches are dropped
+        self._thumb_generation = 0
+        
+        # Only the rows in the visible window are inserted into the tree;
+        # the scrollbar and mouse wheel move the window over self.results
+        self._viewport_first = 0
+        self._viewport_count = 12
+        
+        # Display id of the "select" column (#0 holds the thumbnail)
+        self._select_col_id = "#1"
+        
+        # Pending idle update of the selection label and buttons
+        self._controls_job: Optional[str] = None
+        
+        # Right-click menu, reused for every row
+        self._context_menu: Optional[tk.Menu] = None
+        self._context_item: Optional[str] = None
         
         self._setup_ui()
-        self._setup_bindings()
     
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -160,46 +279,45 @@ class ResultList(ctk.CTkFrame):
         self._update_controls_state()
     
     def _create_results_table(self) -> None:
-        """Create results table with scrollbar."""
+        """Create the results area; the table itself is built on first results."""
         # Create frame for table and scrollbar
-        table_frame = ctk.CTkFrame(self)
-        table_frame.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0, 8))
-        table_frame.grid_columnconfigure(0, weight=1)
-        table_frame.grid_rowconfigure(0, weight=1)
+        self.table_frame = ctk.CTkFrame(self)
+        self.table_frame.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0, 8))
+        self.table_frame.grid_columnconfigure(0, weight=1)
+        self.table_frame.grid_rowconfigure(0, weight=1)
+        
+        self.tree: Optional[ttk.Treeview] = None
+        self.scrollbar: Optional[ctk.CTkScrollbar] = None
         
+        # Create placeholder label
+        self.placeholder_label = ctk.CTkLabel(
+            self.table_frame,
+            text="🔍 No search results to display\n\nUse the search panel to find YouTube videos",
+            font=theme_manager.get_font("body"),
+            text_color=theme_manager.get_color("text_secondary"),
+            justify="center"
+        )
+        self.placeholder_label.grid(row=0, column=0, sticky="nsew")
+    
+    def _build_tree(self) -> None:
+        """Create the treeview and scrollbar."""
         # Create treeview style
-        style = ttk.Style()
-        style.theme_use("clam")
-        
-        # Configure treeview colors to match CustomTkinter theme
-        style.configure("Custom.Treeview",
-                       background=theme_manager.get_color("bg_secondary"),
-                       foreground=theme_manager.get_color("text_primary"),
-                       fieldbackground=theme_manager.get_color("bg_secondary"),
-                       borderwidth=0,
-                       font=theme_manager.get_font("small"))
-        
-        style.configure("Custom.Treeview.Heading",
-                       background=theme_manager.get_color("accent"),
-                       foreground="white",
-                       font=theme_manager.get_font("body"),
-                       borderwidth=1,
-                       relief="solid")
-        
-        # Create treeview
-        columns = ("select", "thumbnail", "title", "duration", "uploader", "views", "date")
+        _configure_style_once(self._THUMBNAIL_SIZE[1] + 4)
+        
+        # Create treeview; thumbnails are item images in the tree column (#0)
+        columns = ("select", "title", "duration", "uploader", "views", "date")
         
         self.tree = ttk.Treeview(
-            table_frame,
+            self.table_frame,
             columns=columns,
-            show="headings",
+            show="tree headings",
             style="Custom.Treeview",
-            height=12
+            height=self._viewport_count
         )
         
         # Configure columns
+        self.tree.heading("#0", text="🖼️", anchor="center")
         self.tree.heading("select", text="☐", anchor="center")
-        self.tree.heading("thumbnail", text="🖼️", anchor="center")
         self.tree.heading("title", text="Title", anchor="w")
         self.tree.heading("duration", text="Duration", anchor="center")
         self.tree.heading("uploader", text="Channel", anchor="w")
@@ -207,33 +325,20 @@ class ResultList(ctk.CTkFrame):
         self.tree.heading("date", text="Upload Date", anchor="center")
         
         # Configure column widths
+        self.tree.column("#0", width=self._THUMBNAIL_SIZE[0] + 16, minwidth=80, anchor="center", stretch=False)
         self.tree.column("select", width=40, minwidth=40, anchor="center")
-        self.tree.column("thumbnail", width=80, minwidth=80, anchor="center")
         self.tree.column("title", width=300, minwidth=200, anchor="w")
         self.tree.column("duration", width=80, minwidth=80, anchor="center")
         self.tree.column("uploader", width=150, minwidth=100, anchor="w")
         self.tree.column("views", width=100, minwidth=80, anchor="center")
         self.tree.column("date", width=100, minwidth=80, anchor="center")
         
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        
-        # Create scrollbar
-        scrollbar = ctk.CTkScrollbar(table_frame, command=self.tree.yview)
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        # Create placeholder label
-        self.placeholder_label = ctk.CTkLabel(
-            table_frame,
-            text="🔍 No search results to display\n\nUse the search panel to find YouTube videos",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_secondary"),
-            justify="center"
-        )
-        self.placeholder_label.grid(row=0, column=0, sticky="nsew")
+        # Create scrollbar; it scrolls the row window rather than the tree
+        self.scrollbar = ctk.CTkScrollbar(self.table_frame, command=self._on_scroll)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
         
-        # Initially show placeholder
-        self._show_placeholder(True)
+        self.tk.eval(_INSERT_ROWS_PROC)
+        self._setup_bindings()
     
     def _create_status_bar(self) -> None:
         """Create status bar."""
@@ -261,7 +366,7 @@ class ResultList(ctk.CTkFrame):
         self.loading_label.grid(row=0, column=1, sticky="e", padx=12, pady=6)
     
     def _setup_bindings(self) -> None:
-        """Set up event bindings."""
+        """Set up treeview event bindings."""
         # Double-click to open video
         self.tree.bind("<Double-1>", self._on_item_double_click)
         
@@ -270,11 +375,18 @@ class ResultList(ctk.CTkFrame):
         
         # Right-click context menu
         self.tree.bind("<Button-3>", self._show_context_menu)
+        
+        # Scrolling and resizing move or resize the row window
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", self._on_mouse_wheel)
+        self.tree.bind("<Button-5>", self._on_mouse_wheel)
+        self.tree.bind("<Configure>", self._on_tree_configure)
     
     def _show_placeholder(self, show: bool) -> None:
         """Show or hide placeholder text."""
         if show:
-            self.tree.grid_remove()
+            if self.tree is not None:
+                self.tree.grid_remove()
             self.placeholder_label.grid(row=0, column=0, sticky="nsew")
         else:
             self.placeholder_label.grid_remove()
@@ -285,16 +397,16 @@ class ResultList(ctk.CTkFrame):
         for result in self.results:
             result.selected = True
             self.selected_items.add(result.video_id)
-        self._refresh_table()
-        self._update_controls_state()
+        self._refresh_selection_column()
+        self._schedule_controls_update()
     
     def _select_none(self) -> None:
         """Deselect all items."""
         for result in self.results:
             result.selected = False
         self.selected_items.clear()
-        self._refresh_table()
-        self._update_controls_state()
+        self._refresh_selection_column()
+        self._schedule_controls_update()
     
     def _invert_selection(self) -> None:
         """Invert current selection."""
@@ -304,8 +416,8 @@ class ResultList(ctk.CTkFrame):
                 self.selected_items.add(result.video_id)
             else:
                 self.selected_items.discard(result.video_id)
-        self._refresh_table()
-        self._update_controls_state()
+        self._refresh_selection_column()
+        self._schedule_controls_update()
     
     def _download_selected(self) -> None:
         """Download selected videos."""
@@ -315,73 +427,81 @@ class ResultList(ctk.CTkFrame):
     
     def _on_item_click(self, event) -> None:
         """Handle item click."""
-        region = self.tree.identify_region(event.x, event.y)
-        if region == "cell":
-            column = self.tree.identify_column(event.x, event.y)
+        if self.tree.identify("region", event.x, event.y) != "cell":
+            return
+        
+        if self.tree.identify_column(event.x) == self._select_col_id:
             item_id = self.tree.identify_row(event.y)
-            
-            if column == "#1" and item_id:  # Select column
+            if item_id:
                 self._toggle_item_selection(item_id)
     
     def _on_item_double_click(self, event) -> None:
         """Handle item double-click to open video."""
-        item_id = self.tree.selection()[0] if self.tree.selection() else None
-        if item_id:
-            item_index = int(item_id) - 1
-            if 0 <= item_index < len(self.results):
-                video_url = self.results[item_index].url
-                webbrowser.open(video_url)
+        selection = self.tree.selection()
+        if not selection:
+            return
+        
+        result = self._by_id.get(selection[0])
+        if result:
+            webbrowser.open(result.url)
     
     def _toggle_item_selection(self, item_id: str) -> None:
         """Toggle selection of an item."""
-        try:
-            item_index = int(item_id) - 1
-            if 0 <= item_index < len(self.results):
-                result = self.results[item_index]
-                result.selected = not result.selected
-                
-                if result.selected:
-                    self.selected_items.add(result.video_id)
-                else:
-                    self.selected_items.discard(result.video_id)
-                
-                self._refresh_table()
-                self._update_controls_state()
-        except (ValueError, IndexError):
-            pass
+        result = self._by_id.get(item_id)
+        if result is None:
+            return
+        
+        result.selected = not result.selected
+        if result.selected:
+            self.selected_items.add(result.video_id)
+        else:
+            self.selected_items.discard(result.video_id)
+        
+        if self.tree.exists(item_id):
+            self.tree.set(item_id, "select", _SELECT_GLYPHS[result.selected])
+        self._schedule_controls_update()
     
     def _show_context_menu(self, event) -> None:
         """Show context menu."""
         item_id = self.tree.identify_row(event.y)
-        if item_id:
-            self.tree.selection_set(item_id)
-            
-            # Create context menu
-            context_menu = tk.Menu(self, tearoff=0)
-            context_menu.add_command(label="Open in Browser", command=lambda: self._on_item_double_click(event))
-            context_menu.add_separator()
-            context_menu.add_command(label="Select", command=lambda: self._toggle_item_selection(item_id))
-            context_menu.add_separator()
-            context_menu.add_command(label="Copy URL", command=lambda: self._copy_url(item_id))
-            
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
+        if not item_id:
+            return
+        
+        self.tree.selection_set(item_id)
+        self._context_item = item_id
+        
+        # Create the context menu on first use; its commands act on _context_item
+        if self._context_menu is None:
+            self._context_menu = tk.Menu(self, tearoff=0)
+            self._context_menu.add_command(label="Open in Browser", command=lambda: self._on_item_double_click(None))
+            self._context_menu.add_separator()
+            self._context_menu.add_command(label="Select", command=lambda: self._toggle_item_selection(self._context_item))
+            self._context_menu.add_separator()
+            self._context_menu.add_command(label="Copy URL", command=lambda: self._copy_url(self._context_item))
+        
+        try:
+            self._context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self._context_menu.grab_release()
     
     def _copy_url(self, item_id: str) -> None:
         """Copy video URL to clipboard."""
-        try:
-            item_index = int(item_id) - 1
-            if 0 <= item_index < len(self.results):
-                url = self.results[item_index].url
-                self.clipboard_clear()
-                self.clipboard_append(url)
-        except (ValueError, IndexError):
-            pass
+        result = self._by_id.get(item_id)
+        if result:
+            self.clipboard_clear()
+            self.clipboard_append(result.url)
+    
+    def _schedule_controls_update(self) -> None:
+        """Update the controls once the current burst of changes is done."""
+        if self._controls_job is None:
+            self._controls_job = self.after_idle(self._update_controls_state)
     
     def _update_controls_state(self) -> None:
         """Update control buttons state."""
+        if self._controls_job is not None:
+            self.after_cancel(self._controls_job)
+            self._controls_job = None
+        
         has_results = len(self.results) > 0
         has_selection = len(self.selected_items) > 0
         
@@ -401,91 +521,274 @@ class ResultList(ctk.CTkFrame):
     
     def _refresh_table(self) -> None:
         """Refresh table display."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add results
-        for i, result in enumerate(self.results, 1):
-            select_text = "☑️" if result.selected else "☐"
-            thumbnail_text = "🖼️"  # Placeholder for thumbnail
-            
-            # Format duration
-            duration_text = self._format_duration(result.duration)
-            
-            # Format view count
-            views_text = self._format_number(result.view_count)
-            
-            # Format upload date
-            date_text = result.upload_date[:10] if result.upload_date else "Unknown"
-            
-            # Truncate title if too long
-            title_text = result.title[:50] + "..." if len(result.title) > 50 else result.title
-            
-            # Truncate uploader if too long
-            uploader_text = result.uploader[:20] + "..." if len(result.uploader) > 20 else result.uploader
-            
-            self.tree.insert("", "end", iid=str(i), values=(
-                select_text,
-                thumbnail_text,
-                title_text,
-                duration_text,
-                uploader_text,
-                views_text,
-                date_text
-            ))
-    
-    def _format_duration(self, seconds: int) -> str:
+        self._delete_tree_rows()
+        
+        # Add the rows in the visible window
+        self._scroll_to(self._viewport_first)
+    
+    def _delete_tree_rows(self) -> None:
+        """Remove every row from the tree in a single call."""
+        if self.tree is None:
+            return
+        
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+    
+    def _refresh_selection_column(self) -> None:
+        """Update the select cell of the rows currently in the tree."""
+        if self.tree is None:
+            return
+        
+        for item_id in self.tree.get_children():
+            result = self._by_id[item_id]
+            self.tree.set(item_id, "select", _SELECT_GLYPHS[result.selected])
+    
+    def _format_row(self, result: VideoResultItem) -> tuple:
+        """Build the column values for a result row, except the select column."""
+        # Format duration
+        duration_text = self._format_duration(result.duration)
+        
+        # Format view count
+        views_text = self._format_number(result.view_count)
+        
+        # Format upload date
+        date_text = result.upload_date[:10] if result.upload_date else "Unknown"
+        
+        # Truncate title and uploader if too long
+        title_text = _truncate(result.title, 50)
+        uploader_text = _truncate(result.uploader, 20)
+        
+        return (
+            title_text,
+            duration_text,
+            uploader_text,
+            views_text,
+            date_text
+        )
+    
+    def _scroll_to(self, first: int) -> None:
+        """Move the row window to start at the given result index."""
+        self._viewport_first = max(0, min(first, len(self.results) - self._viewport_count))
+        self._render_window()
+        
+        total = len(self.results)
+        if total:
+            self.scrollbar.set(self._viewport_first / total,
+                               min(1.0, (self._viewport_first + self._viewport_count) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def _render_window(self) -> None:
+        """Insert and delete tree rows so only the visible window is present."""
+        first = self._viewport_first
+        last = min(len(self.results), first + self._viewport_count)
+        wanted = {result.video_id for result in self.results[first:last]}
+        
+        stale = [item for item in self.tree.get_children() if item not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+        
+        inserts = []
+        rows = zip(self.results[first:last], self._row_cache[first:last])
+        for position, (result, row) in enumerate(rows):
+            item_id = result.video_id
+            if not self.tree.exists(item_id):
+                thumbnail = self._request_thumbnail(result)
+                options = {"image": thumbnail} if thumbnail is not None else {"text": "🖼️"}
+                values = (_SELECT_GLYPHS[result.selected], *row)
+                inserts.append((position, item_id, options, values))
+        
+        if len(inserts) > 1:
+            try:
+                self._insert_rows_batched(inserts)
+                return
+            except tk.TclError:
+                pass  # Fall back to inserting row by row
+        
+        for position, item_id, options, values in inserts:
+            if not self.tree.exists(item_id):
+                self.tree.insert("", position, iid=item_id, values=values, **options)
+    
+    def _insert_rows_batched(self, inserts: List[tuple]) -> None:
+        """Insert rows with a single Tcl call instead of one call per row."""
+        rows = []
+        for position, item_id, options, values in inserts:
+            row = ["", position, "-id", item_id, "-values", values]
+            for option, value in options.items():
+                row += ["-" + option, value]
+            rows.append(tuple(row))
+        self.tk.call("::_rl_insert_rows", str(self.tree), tuple(rows))
+    
+    def _request_thumbnail(self, result: VideoResultItem) -> Optional[ImageTk.PhotoImage]:
+        """Return a cached thumbnail, or start loading it and return None."""
+        video_id = result.video_id
+        thumbnail = self.thumbnail_cache.get(video_id)
+        if thumbnail is not None:
+            self.thumbnail_cache.move_to_end(video_id)
+            return thumbnail
+        
+        if result.thumbnail_url and video_id not in self._thumb_pending:
+            self._thumb_pending[video_id] = self._thumb_pool.submit(
+                self._fetch_thumbnail, video_id, result.thumbnail_url, self._thumb_generation
+            )
+        return None
+    
+    def _cancel_thumbnail_fetches(self) -> None:
+        """Drop thumbnail fetches started for the previous result set."""
+        self._thumb_generation += 1
+        for future in self._thumb_pending.values():
+            future.cancel()  # Only succeeds for fetches still queued
+        self._thumb_pending.clear()
+    
+    def _prefetch_thumbnails(self) -> None:
+        """Queue thumbnails for the first results after the visible rows."""
+        # Visible rows were requested while rendering, so they are fetched first
+        for result in self.results[:self._THUMBNAIL_PREFETCH]:
+            self._request_thumbnail(result)
+    
+    def _fetch_thumbnail(self, video_id: str, url: str, generation: int) -> None:
+        """Download and decode a thumbnail (worker thread)."""
+        if generation != self._thumb_generation:
+            return
+        
+        try:
+            with _thumb_session.get(url, headers={"Accept-Encoding": "gzip"},
+                                    timeout=5, stream=True) as response:
+                response.raise_for_status()
+                data = response.raw.read(decode_content=True)
+            image = _decode_thumbnail(data, *self._THUMBNAIL_SIZE)
+        except Exception:
+            image = None
+        
+        try:
+            self.after(0, self._apply_thumbnail, video_id, image, generation)
+        except (RuntimeError, tk.TclError):
+            pass  # Widget destroyed while loading
+    
+    def _apply_thumbnail(self, video_id: str, image: Optional[Image.Image], generation: int) -> None:
+        """Cache a loaded thumbnail and show it on visible rows."""
+        if generation != self._thumb_generation:
+            return
+        
+        self._thumb_pending.pop(video_id, None)
+        if image is None:
+            return
+        
+        thumbnail = ImageTk.PhotoImage(image)
+        self.thumbnail_cache[video_id] = thumbnail
+        while len(self.thumbnail_cache) > self._THUMBNAIL_CACHE_SIZE:
+            self.thumbnail_cache.popitem(last=False)
+        
+        if self.tree.exists(video_id):
+            self.tree.item(video_id, image=thumbnail, text="")
+    
+    def _on_scroll(self, *args) -> None:
+        """Handle scrollbar commands ("moveto" or "scroll")."""
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self.results)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._viewport_count
+            self._scroll_to(self._viewport_first + step)
+    
+    def _on_mouse_wheel(self, event) -> str:
+        """Scroll the row window by three rows per wheel step."""
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._viewport_first - 3)
+        else:
+            self._scroll_to(self._viewport_first + 3)
+        return "break"
+    
+    def _on_tree_configure(self, event) -> None:
+        """Resize the row window to the number of rows that fit."""
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else ""
+        if not bbox:
+            return
+        _, first_row_y, _, row_height = bbox
+        count = max(1, (event.height - first_row_y) // row_height)
+        if count != self._viewport_count:
+            self._viewport_count = count
+            self._scroll_to(self._viewport_first)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_duration(seconds: int) -> str:
         """Format duration in seconds to MM:SS or HH:MM:SS."""
         if seconds <= 0:
             return "0:00"
         
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+        hours, rem = divmod(seconds, 3600)
+        minutes, secs = divmod(rem, 60)
         
         if hours > 0:
             return f"{hours}:{minutes:02d}:{secs:02d}"
         else:
             return f"{minutes}:{secs:02d}"
     
-    def _format_number(self, num: int) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_number(num: int) -> str:
         """Format large numbers with K/M/B suffixes."""
-        if num >= 1_000_000_000:
-            return f"{num/1_000_000_000:.1f}B"
-        elif num >= 1_000_000:
-            return f"{num/1_000_000:.1f}M"
-        elif num >= 1_000:
-            return f"{num/1_000:.1f}K"
-        else:
-            return str(num)
+        for threshold, suffix in _NUMBER_SUFFIXES:
+            if num >= threshold:
+                return f"{num/threshold:.1f}{suffix}"
+        return str(num)
+    
+    def destroy(self) -> None:
+        """Stop thumbnail loading and destroy the widget."""
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        if self._controls_job is not None:
+            self.after_cancel(self._controls_job)
+            self._controls_job = None
+        super().destroy()
     
     def set_results(self, results: List[Dict[str, Any]]) -> None:
         """Set search results to display."""
         self.loading_label.configure(text="")
         
-        # Convert dict results to VideoResultItem objects
-        self.results = [VideoResultItem(result) for result in results]
+        # Convert dict results to VideoResultItem objects; video_id is the
+        # tree item id, so results without one or repeating one are dropped
+        self._cancel_thumbnail_fetches()
+        self._by_id = {}
+        for data in results:
+            result = VideoResultItem(data)
+            if result.video_id:
+                self._by_id.setdefault(result.video_id, result)
+        self.results = list(self._by_id.values())
+        self._row_cache = [self._format_row(result) for result in self.results]
         self.selected_items.clear()
+        self._viewport_first = 0
         
         # Update display
         if self.results:
+            if self.tree is None:
+                self._build_tree()
             self._show_placeholder(False)
             self._refresh_table()
+            self._prefetch_thumbnails()
             self.count_label.configure(text=f"{len(self.results)} results found")
         else:
+            # Rows left from the previous results would no longer be in _by_id
+            self._delete_tree_rows()
             self._show_placeholder(True)
             self.count_label.configure(text="No results found")
         
-        self._update_controls_state()
+        self._schedule_controls_update()
     
     def clear_results(self) -> None:
         """Clear all results."""
         self.results.clear()
+        self._by_id.clear()
+        self._delete_tree_rows()
+        self._cancel_thumbnail_fetches()
+        self._row_cache.clear()
         self.selected_items.clear()
         self._show_placeholder(True)
         self.count_label.configure(text="No results")
-        self._update_controls_state()
+        self._schedule_controls_update()
         self.loading_label.configure(text="")
     
     def set_loading(self, message: str = "Searching...") -> None:
@@ -507,5 +810,5 @@ class ResultList(ctk.CTkFrame):
             else:
                 result.selected = False
         
-        self._refresh_table()
-        self._update_controls_state() 
\ No newline at end of file
+        self._refresh_selection_column()
+        self._schedule_controls_update() 
\ No newline at end of file
@@ -6,7 +6,9 @@ keyword input, filtering options, and search parameters configuration.
 """
 
 import tkinter as tk
+from tkinter import messagebox
 import customtkinter as ctk
+from functools import partial
 from typing import Callable, Optional, Dict, Any
 from pathlib import Path
 
@@ -14,6 +16,23 @@ from ..styles.themes import theme_manager
 from ...core.search_config import SearchConfig, FilterConfig
 
 
+# UI labels mapped to SearchConfig values, in display order
+_SORT_MAPPING = {
+    "Relevance": "relevance",
+    "Upload Date": "upload_date",
+    "View Count": "view_count",
+    "Rating": "rating"
+}
+
+_UPLOAD_DATE_MAPPING = {
+    "Any Time": "any",
+    "Past Hour": "hour",
+    "Today": "today",
+    "This Week": "week",
+    "This Month": "month",
+    "This Year": "year"
+}
+
 class SearchPanel(ctk.CTkFrame):
     """
     Modern search panel for YouTube video search configuration.
@@ -26,6 +45,18 @@ class SearchPanel(ctk.CTkFrame):
     - Advanced options (upload date filter, exclude shorts/live)
     """
     
+    # Input values the panel starts with and returns to on reset()
+    _DEFAULT_STATE = {
+        "quantity": 10,
+        "sort": "Relevance",
+        "min_duration": 0,
+        "max_duration": 3600,  # 1 hour
+        "upload_date": "Any Time",
+        "exclude_shorts": True,
+        "exclude_live": True,
+        "min_quality": "Any",
+    }
+    
     def __init__(self, parent, on_search_clicked: Optional[Callable[[SearchConfig], None]] = None):
         """
         Initialize search panel.
@@ -36,12 +67,46 @@ class SearchPanel(ctk.CTkFrame):
         """
         super().__init__(parent)
         
+        # Theme values shared by the panel's widgets, looked up once
+        self._style = {
+            "font_body": theme_manager.get_font("body"),
+            "font_small": theme_manager.get_font("small"),
+            "font_heading": theme_manager.get_font("heading"),
+            "font_subheading": theme_manager.get_font("subheading"),
+            "c_primary": theme_manager.get_color("text_primary"),
+            "c_secondary": theme_manager.get_color("text_secondary"),
+            "c_accent": theme_manager.get_color("accent"),
+            "c_hover": theme_manager.get_color("primary_hover"),
+        }
+        
         self.on_search_clicked = on_search_clicked
         self.is_searching = False
         
+        # Last applied search button and advanced section states
+        self._btn_state = "normal"
+        self._advanced_visible = False
+        
         # Initialize default search configuration
         self.current_config = SearchConfig()
         
+        # Last config built from the widgets; cleared when any of them change
+        self._config_cache: Optional[SearchConfig] = None
+        
+        # Integer values of the number entries (None while empty), updated
+        # as they are typed and by every programmatic write
+        defaults = self._DEFAULT_STATE
+        self._quantity_int: Optional[int] = defaults["quantity"]
+        self._min_dur_int: Optional[int] = defaults["min_duration"]
+        self._max_dur_int: Optional[int] = defaults["max_duration"]
+        
+        # Combobox selections, kept current by their command callbacks
+        self._sort_value = defaults["sort"]
+        self._upload_date_value = defaults["upload_date"]
+        self._min_quality_value = defaults["min_quality"]
+        
+        # (variable, trace id) pairs that clear the cached config
+        self._config_traces = []
+        
         self._setup_ui()
         self._setup_bindings()
     
@@ -53,8 +118,8 @@ class SearchPanel(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="🔍 YouTube Search & Download",
-            font=theme_manager.get_font("subheading"),
-            text_color=theme_manager.get_color("accent")
+            font=self._style["font_subheading"],
+            text_color=self._style["c_accent"]
         )
         title_label.grid(row=0, column=0, columnspan=2, sticky="w", 
                         padx=12, pady=(12, 8))
@@ -82,8 +147,8 @@ class SearchPanel(ctk.CTkFrame):
         search_label = ctk.CTkLabel(
             self,
             text="Search Keywords",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._style["font_body"],
+            text_color=self._style["c_primary"]
         )
         search_label.grid(row=row, column=0, sticky="w", padx=12, pady=(8, 4))
         
@@ -91,7 +156,7 @@ class SearchPanel(ctk.CTkFrame):
         self.search_entry = ctk.CTkEntry(
             self,
             placeholder_text="Enter search keywords (e.g. 'python tutorial', 'music covers')",
-            font=theme_manager.get_font("body"),
+            font=self._style["font_body"],
             height=36
         )
         self.search_entry.grid(row=row+1, column=0, columnspan=2, sticky="ew", 
@@ -112,17 +177,17 @@ class SearchPanel(ctk.CTkFrame):
         quantity_label = ctk.CTkLabel(
             params_frame,
             text="Videos to Download:",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._style["font_body"],
+            text_color=self._style["c_primary"]
         )
         quantity_label.grid(row=0, column=0, sticky="w", padx=12, pady=8)
         
-        self.quantity_var = tk.StringVar(value="10")
+        self.quantity_var = tk.StringVar(value=str(self._DEFAULT_STATE["quantity"]))
         self.quantity_spinbox = ctk.CTkEntry(
             params_frame,
             textvariable=self.quantity_var,
             width=80,
-            font=theme_manager.get_font("body")
+            font=self._style["font_body"]
         )
         self.quantity_spinbox.grid(row=0, column=1, sticky="w", padx=(8, 20), pady=8)
         
@@ -130,19 +195,20 @@ class SearchPanel(ctk.CTkFrame):
         sort_label = ctk.CTkLabel(
             params_frame,
             text="Sort by:",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._style["font_body"],
+            text_color=self._style["c_primary"]
         )
         sort_label.grid(row=0, column=2, sticky="w", padx=12, pady=8)
         
         self.sort_combo = ctk.CTkComboBox(
             params_frame,
-            values=["Relevance", "Upload Date", "View Count", "Rating"],
+            values=list(_SORT_MAPPING),
             state="readonly",
-            font=theme_manager.get_font("body"),
-            width=120
+            font=self._style["font_body"],
+            width=120,
+            command=self._on_sort_changed
         )
-        self.sort_combo.set("Relevance")
+        self.sort_combo.set(self._sort_value)
         self.sort_combo.grid(row=0, column=3, sticky="w", padx=(8, 12), pady=8)
     
     def _create_duration_section(self) -> None:
@@ -153,8 +219,8 @@ class SearchPanel(ctk.CTkFrame):
         duration_label = ctk.CTkLabel(
             self,
             text="Duration Filters",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._style["font_body"],
+            text_color=self._style["c_primary"]
         )
         duration_label.grid(row=row, column=0, sticky="w", padx=12, pady=(8, 4))
         
@@ -168,17 +234,17 @@ class SearchPanel(ctk.CTkFrame):
         min_dur_label = ctk.CTkLabel(
             duration_frame,
             text="Min Duration (seconds):",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._style["font_small"],
+            text_color=self._style["c_secondary"]
         )
         min_dur_label.grid(row=0, column=0, sticky="w", padx=12, pady=(8, 4))
         
-        self.min_duration_var = tk.StringVar(value="0")
+        self.min_duration_var = tk.StringVar(value=str(self._DEFAULT_STATE["min_duration"]))
         self.min_duration_entry = ctk.CTkEntry(
             duration_frame,
             textvariable=self.min_duration_var,
             width=100,
-            font=theme_manager.get_font("body")
+            font=self._style["font_body"]
         )
         self.min_duration_entry.grid(row=0, column=1, sticky="w", padx=(8, 12), pady=(8, 4))
         
@@ -186,29 +252,29 @@ class SearchPanel(ctk.CTkFrame):
         max_dur_label = ctk.CTkLabel(
             duration_frame,
             text="Max Duration (seconds):",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._style["font_small"],
+            text_color=self._style["c_secondary"]
         )
         max_dur_label.grid(row=1, column=0, sticky="w", padx=12, pady=(4, 8))
         
-        self.max_duration_var = tk.StringVar(value="3600")  # 1 hour default
+        self.max_duration_var = tk.StringVar(value=str(self._DEFAULT_STATE["max_duration"]))
         self.max_duration_entry = ctk.CTkEntry(
             duration_frame,
             textvariable=self.max_duration_var,
             width=100,
-            font=theme_manager.get_font("body")
+            font=self._style["font_body"]
         )
         self.max_duration_entry.grid(row=1, column=1, sticky="w", padx=(8, 12), pady=(4, 8))
         
         # Duration presets
-        presets_frame = ctk.CTkFrame(duration_frame)
+        presets_frame = ctk.CTkFrame(duration_frame, fg_color="transparent")
         presets_frame.grid(row=0, column=2, rowspan=2, sticky="nsew", padx=(20, 12), pady=8)
         
         presets_label = ctk.CTkLabel(
             presets_frame,
             text="Quick Presets:",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._style["font_small"],
+            text_color=self._style["c_secondary"]
         )
         presets_label.grid(row=0, column=0, columnspan=3, padx=8, pady=(8, 4))
         
@@ -225,13 +291,13 @@ class SearchPanel(ctk.CTkFrame):
                 text=text,
                 width=90,
                 height=24,
-                font=theme_manager.get_font("small"),
-                command=lambda m=min_val, x=max_val: self._set_duration_preset(m, x)
+                font=self._style["font_small"],
+                command=partial(self._set_duration_preset, min_val, max_val)
             )
             btn.grid(row=1, column=i, padx=4, pady=(0, 8))
     
     def _create_advanced_section(self) -> None:
-        """Create advanced options section."""
+        """Create advanced options section; its content is built on first expand."""
         row = 6
         
         # Advanced options collapsible frame
@@ -246,50 +312,60 @@ class SearchPanel(ctk.CTkFrame):
             self.advanced_frame,
             text="Advanced Options",
             variable=self.show_advanced,
-            font=theme_manager.get_font("body"),
+            font=self._style["font_body"],
             command=self._toggle_advanced_options
         )
         self.advanced_toggle.grid(row=0, column=0, sticky="w", padx=12, pady=8)
         
-        # Advanced options content (initially hidden)
-        self.advanced_content = ctk.CTkFrame(self.advanced_frame)
+        # Content filter variables are read by the config even while collapsed
+        self.exclude_shorts_var = tk.BooleanVar(value=self._DEFAULT_STATE["exclude_shorts"])
+        self.exclude_live_var = tk.BooleanVar(value=self._DEFAULT_STATE["exclude_live"])
+        
+        self.advanced_content: Optional[ctk.CTkFrame] = None
+        self.upload_date_combo: Optional[ctk.CTkComboBox] = None
+        self.exclude_shorts_cb: Optional[ctk.CTkCheckBox] = None
+        self.exclude_live_cb: Optional[ctk.CTkCheckBox] = None
+        self.min_quality_combo: Optional[ctk.CTkComboBox] = None
+    
+    def _build_advanced_content(self) -> None:
+        """Create the advanced options widgets."""
+        self.advanced_content = ctk.CTkFrame(self.advanced_frame, fg_color="transparent")
         self.advanced_content.grid_columnconfigure((0, 1), weight=1)
         
         # Upload date filter
         upload_date_label = ctk.CTkLabel(
             self.advanced_content,
             text="Upload Date:",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._style["font_small"],
+            text_color=self._style["c_secondary"]
         )
         upload_date_label.grid(row=0, column=0, sticky="w", padx=12, pady=(8, 4))
         
         self.upload_date_combo = ctk.CTkComboBox(
             self.advanced_content,
-            values=["Any Time", "Past Hour", "Today", "This Week", "This Month", "This Year"],
+            values=list(_UPLOAD_DATE_MAPPING),
             state="readonly",
-            font=theme_manager.get_font("small"),
-            width=120
+            font=self._style["font_small"],
+            width=120,
+            command=self._on_upload_date_changed
         )
-        self.upload_date_combo.set("Any Time")
+        self.upload_date_combo.set(self._upload_date_value)
         self.upload_date_combo.grid(row=0, column=1, sticky="w", padx=(8, 12), pady=(8, 4))
         
         # Content filters
-        self.exclude_shorts_var = tk.BooleanVar(value=True)
         self.exclude_shorts_cb = ctk.CTkCheckBox(
             self.advanced_content,
             text="Exclude YouTube Shorts",
             variable=self.exclude_shorts_var,
-            font=theme_manager.get_font("small")
+            font=self._style["font_small"]
         )
         self.exclude_shorts_cb.grid(row=1, column=0, sticky="w", padx=12, pady=4)
         
-        self.exclude_live_var = tk.BooleanVar(value=True)
         self.exclude_live_cb = ctk.CTkCheckBox(
             self.advanced_content,
             text="Exclude Live Streams",
             variable=self.exclude_live_var,
-            font=theme_manager.get_font("small")
+            font=self._style["font_small"]
         )
         self.exclude_live_cb.grid(row=1, column=1, sticky="w", padx=12, pady=4)
         
@@ -297,8 +373,8 @@ class SearchPanel(ctk.CTkFrame):
         quality_label = ctk.CTkLabel(
             self.advanced_content,
             text="Minimum Quality:",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._style["font_small"],
+            text_color=self._style["c_secondary"]
         )
         quality_label.grid(row=2, column=0, sticky="w", padx=12, pady=(8, 4))
         
@@ -306,10 +382,11 @@ class SearchPanel(ctk.CTkFrame):
             self.advanced_content,
             values=["Any", "360p", "480p", "720p", "1080p"],
             state="readonly",
-            font=theme_manager.get_font("small"),
-            width=80
+            font=self._style["font_small"],
+            width=80,
+            command=self._on_min_quality_changed
         )
-        self.min_quality_combo.set("Any")
+        self.min_quality_combo.set(self._min_quality_value)
         self.min_quality_combo.grid(row=2, column=1, sticky="w", padx=(8, 12), pady=(8, 4))
     
     def _create_search_button(self) -> None:
@@ -327,62 +404,139 @@ class SearchPanel(ctk.CTkFrame):
             button_frame,
             text="🔍 Search & Queue Downloads",
             height=40,
-            font=theme_manager.get_font("heading"),
+            font=self._style["font_heading"],
             command=self._on_search_clicked,
-            fg_color=theme_manager.get_color("accent"),
-            hover_color=theme_manager.get_color("primary_hover")
+            fg_color=self._style["c_accent"],
+            hover_color=self._style["c_hover"]
         )
         self.search_button.grid(row=0, column=0, sticky="ew")
     
     def _setup_bindings(self) -> None:
         """Set up event bindings."""
         # Bind Enter key to search
-        self.search_entry.bind("<Return>", lambda e: self._on_search_clicked())
+        self.search_entry.bind("<Return>", self._on_return)
         
-        # Bind quantity validation
-        self.quantity_spinbox.bind("<KeyRelease>", self._validate_quantity)
+        # Tk rejects non-digit keystrokes itself; range checks run on focus out
+        quantity_vcmd = (self.register(self._on_quantity_text), "%P")
+        self.quantity_spinbox.configure(validate="key", validatecommand=quantity_vcmd)
         self.quantity_spinbox.bind("<FocusOut>", self._validate_quantity)
         
-        # Bind duration validation
-        self.min_duration_entry.bind("<KeyRelease>", self._validate_duration)
-        self.max_duration_entry.bind("<KeyRelease>", self._validate_duration)
+        min_duration_vcmd = (self.register(self._on_min_duration_text), "%P")
+        self.min_duration_entry.configure(validate="key", validatecommand=min_duration_vcmd)
+        max_duration_vcmd = (self.register(self._on_max_duration_text), "%P")
+        self.max_duration_entry.configure(validate="key", validatecommand=max_duration_vcmd)
+        for entry in (self.min_duration_entry, self.max_duration_entry):
+            entry.bind("<FocusOut>", self._validate_duration)
+        
+        # Drop the cached config when an input changes
+        self._add_config_traces()
+    
+    def _add_config_traces(self) -> None:
+        """Trace the input variables so edits clear the cached config."""
+        for var in (self.quantity_var, self.min_duration_var, self.max_duration_var,
+                    self.exclude_shorts_var, self.exclude_live_var):
+            self._config_traces.append((var, var.trace_add("write", self._invalidate_config)))
+    
+    def _remove_config_traces(self) -> None:
+        """Stop tracing the input variables."""
+        for var, trace_id in self._config_traces:
+            var.trace_remove("write", trace_id)
+        self._config_traces.clear()
+    
+    def _on_return(self, event) -> None:
+        """Start a search when Enter is pressed in the keyword entry."""
+        self._on_search_clicked()
+    
+    def _invalidate_config(self, *args) -> None:
+        """Forget the cached search configuration."""
+        self._config_cache = None
+    
+    def _on_sort_changed(self, value: str) -> None:
+        """Record the selected sort order."""
+        self._sort_value = value
+        self._invalidate_config()
+    
+    def _on_upload_date_changed(self, value: str) -> None:
+        """Record the selected upload date filter."""
+        self._upload_date_value = value
+        self._invalidate_config()
+    
+    def _on_min_quality_changed(self, value: str) -> None:
+        """Record the selected minimum quality."""
+        self._min_quality_value = value
+        self._invalidate_config()
     
     def _toggle_advanced_options(self) -> None:
         """Toggle visibility of advanced options."""
-        if self.show_advanced.get():
+        show = self.show_advanced.get()
+        if show == self._advanced_visible:
+            return
+        self._advanced_visible = show
+        
+        if show:
+            if self.advanced_content is None:
+                self._build_advanced_content()
             self.advanced_content.grid(row=1, column=0, columnspan=2, sticky="ew", 
                                      padx=12, pady=(0, 8))
-        else:
+        elif self.advanced_content is not None:
             self.advanced_content.grid_remove()
     
     def _set_duration_preset(self, min_duration: int, max_duration: int) -> None:
         """Set duration values from preset."""
-        self.min_duration_var.set(str(min_duration))
-        self.max_duration_var.set(str(max_duration))
+        self._set_min_duration(min_duration)
+        self._set_max_duration(max_duration)
+    
+    def _set_quantity(self, value: int) -> None:
+        """Set the quantity entry and its integer value."""
+        self._quantity_int = value
+        self.quantity_var.set(str(value))
+    
+    def _set_min_duration(self, value: int) -> None:
+        """Set the min duration entry and its integer value."""
+        self._min_dur_int = value
+        self.min_duration_var.set(str(value))
+    
+    def _set_max_duration(self, value: int) -> None:
+        """Set the max duration entry and its integer value."""
+        self._max_dur_int = value
+        self.max_duration_var.set(str(value))
+    
+    def _on_quantity_text(self, text: str) -> bool:
+        """Accept up to three digits as the quantity is typed."""
+        if text and not (text.isdecimal() and len(text) <= 3):
+            return False
+        self._quantity_int = int(text) if text else None
+        return True
+    
+    def _on_min_duration_text(self, text: str) -> bool:
+        """Accept up to five digits as the min duration is typed."""
+        if text and not (text.isdecimal() and len(text) <= 5):
+            return False
+        self._min_dur_int = int(text) if text else None
+        return True
+    
+    def _on_max_duration_text(self, text: str) -> bool:
+        """Accept up to five digits as the max duration is typed."""
+        if text and not (text.isdecimal() and len(text) <= 5):
+            return False
+        self._max_dur_int = int(text) if text else None
+        return True
     
     def _validate_quantity(self, event=None) -> None:
         """Validate quantity input."""
-        try:
-            value = int(self.quantity_var.get())
-            if value < 1:
-                self.quantity_var.set("1")
-            elif value > 100:
-                self.quantity_var.set("100")
-        except ValueError:
-            self.quantity_var.set("10")
+        if self._quantity_int is None:
+            self._set_quantity(10)
+        elif self._quantity_int < 1:
+            self._set_quantity(1)
+        elif self._quantity_int > 100:
+            self._set_quantity(100)
     
     def _validate_duration(self, event=None) -> None:
         """Validate duration inputs."""
-        try:
-            min_val = int(self.min_duration_var.get()) if self.min_duration_var.get() else 0
-            max_val = int(self.max_duration_var.get()) if self.max_duration_var.get() else 3600
-            
-            if min_val < 0:
-                self.min_duration_var.set("0")
-            if max_val < min_val:
-                self.max_duration_var.set(str(min_val + 60))
-        except ValueError:
-            pass
+        min_val = self._min_dur_int or 0
+        max_val = 3600 if self._max_dur_int is None else self._max_dur_int
+        if max_val < min_val:
+            self._set_max_duration(min_val + 60)
     
     def _on_search_clicked(self) -> None:
         """Handle search button click."""
@@ -391,9 +545,13 @@ class SearchPanel(ctk.CTkFrame):
         
         # Validate inputs
         if not self.search_entry.get().strip():
-            tk.messagebox.showwarning("Search Error", "Please enter search keywords.")
+            messagebox.showwarning("Search Error", "Please enter search keywords.")
             return
         
+        # Apply range checks the entries may not have had a focus out for
+        self._validate_quantity()
+        self._validate_duration()
+        
         # Build search configuration
         config = self._build_search_config()
         
@@ -405,47 +563,40 @@ class SearchPanel(ctk.CTkFrame):
     
     def _build_search_config(self) -> SearchConfig:
         """Build SearchConfig object from current UI state."""
-        # Map UI values to internal values
-        sort_mapping = {
-            "Relevance": "relevance",
-            "Upload Date": "upload_date", 
-            "View Count": "view_count",
-            "Rating": "rating"
-        }
-        
-        upload_date_mapping = {
-            "Any Time": "any",
-            "Past Hour": "hour",
-            "Today": "today",
-            "This Week": "week",
-            "This Month": "month",
-            "This Year": "year"
-        }
+        # The query entry has no variable to trace, so it is compared instead
+        search_query = self.search_entry.get().strip()
+        if self._config_cache is not None and self._config_cache.search_query == search_query:
+            return self._config_cache
         
         # Create filter config
         filter_config = FilterConfig(
-            min_duration=int(self.min_duration_var.get()) if self.min_duration_var.get() else None,
-            max_duration=int(self.max_duration_var.get()) if self.max_duration_var.get() else None,
-            min_quality=self.min_quality_combo.get() if self.min_quality_combo.get() != "Any" else None,
+            min_duration=self._min_dur_int,
+            max_duration=self._max_dur_int,
+            min_quality=self._min_quality_value if self._min_quality_value != "Any" else None,
             exclude_shorts=self.exclude_shorts_var.get(),
             exclude_live=self.exclude_live_var.get()
         )
         
         # Create search config
-        config = SearchConfig(
-            search_query=self.search_entry.get().strip(),
-            max_results=int(self.quantity_var.get()),
-            sort_by=sort_mapping.get(self.sort_combo.get(), "relevance"),
-            upload_date=upload_date_mapping.get(self.upload_date_combo.get(), "any"),
+        self._config_cache = SearchConfig(
+            search_query=search_query,
+            max_results=10 if self._quantity_int is None else self._quantity_int,
+            sort_by=_SORT_MAPPING.get(self._sort_value, "relevance"),
+            upload_date=_UPLOAD_DATE_MAPPING.get(self._upload_date_value, "any"),
             filter_config=filter_config
         )
         
-        return config
+        return self._config_cache
     
     def _update_search_state(self, searching: bool) -> None:
         """Update UI elements based on search state."""
         self.is_searching = searching
         
+        target = "searching" if searching else "normal"
+        if target == self._btn_state:
+            return
+        self._btn_state = target
+        
         if searching:
             self.search_button.configure(
                 text="🔄 Searching...",
@@ -467,15 +618,26 @@ class SearchPanel(ctk.CTkFrame):
     
     def reset(self) -> None:
         """Reset the search panel to default state."""
+        defaults = self._DEFAULT_STATE
         self.search_entry.delete(0, tk.END)
-        self.quantity_var.set("10")
-        self.sort_combo.set("Relevance")
-        self.min_duration_var.set("0")
-        self.max_duration_var.set("3600")
-        self.upload_date_combo.set("Any Time")
-        self.exclude_shorts_var.set(True)
-        self.exclude_live_var.set(True)
-        self.min_quality_combo.set("Any")
+        
+        # Write every input with the traces detached, then invalidate once
+        self._remove_config_traces()
+        self._set_quantity(defaults["quantity"])
+        self._set_min_duration(defaults["min_duration"])
+        self._set_max_duration(defaults["max_duration"])
+        self.exclude_shorts_var.set(defaults["exclude_shorts"])
+        self.exclude_live_var.set(defaults["exclude_live"])
+        self._add_config_traces()
+        
+        self._sort_value = defaults["sort"]
+        self._upload_date_value = defaults["upload_date"]
+        self._min_quality_value = defaults["min_quality"]
+        self.sort_combo.set(self._sort_value)
+        if self.advanced_content is not None:
+            self.upload_date_combo.set(self._upload_date_value)
+            self.min_quality_combo.set(self._min_quality_value)
+        self._invalidate_config()
         self.show_advanced.set(False)
         self._toggle_advanced_options()
         self.search_completed() 
\ No newline at end of file
@@ -6,15 +6,82 @@ quality selection, format options, and output directory management.
 """
 
 import os
+import json
+import threading
+from types import MappingProxyType
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Mapping, Tuple
 from pathlib import Path
+from functools import lru_cache
 
 from ..styles.themes import theme_manager
 from ...core.config import DownloadConfig
 
+# UI labels mapped to DownloadConfig quality values, in display order
+_QUALITY_MAPPING = {
+    "Best": "best",
+    "1080p": "1080p",
+    "720p": "720p",
+    "480p": "480p",
+    "360p": "360p",
+    "Worst": "worst"
+}
+_QUALITY_LABELS = {value: label for label, value in _QUALITY_MAPPING.items()}
+
+# Last-used settings, restored on the next launch
+_SETTINGS_FILE = Path.home() / ".youtube-downloader" / "gui_settings.json"
+
+
+@lru_cache(maxsize=1)
+def _load_saved_settings(path: str) -> Dict[str, Any]:
+    """Load settings saved by a previous session, or {} if there are none."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_settings(path: str, settings: Dict[str, Any]) -> None:
+    """Write settings atomically; failures only cost persistence."""
+    target = Path(path)
+    tmp = target.with_suffix(".tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(settings, indent=2), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+def _probe_directory(path: str) -> Tuple[str, str]:
+    """
+    Check an output directory on disk.
+    
+    May block on slow or offline storage, so it is run off the UI thread.
+    
+    Returns:
+        Tuple[str, str]: Status message and theme color name
+    """
+    try:
+        path_obj = Path(path)
+        
+        if path_obj.exists() and path_obj.is_dir():
+            # Check write permissions
+            if os.access(path, os.W_OK):
+                return "✓ Directory exists and is writable", "success"
+            return "⚠ Directory exists but is not writable", "warning"
+        
+        parent_dir = path_obj.parent
+        if parent_dir.exists() and os.access(parent_dir, os.W_OK):
+            return "📁 Directory will be created", "info"
+    except (OSError, ValueError):
+        pass
+    
+    return "✗ Invalid path or parent directory not accessible", "error"
+
 
 class SettingsPanel(ctk.CTkFrame):
     """
@@ -28,13 +95,17 @@ class SettingsPanel(ctk.CTkFrame):
     - Settings persistence
     """
     
-    def __init__(self, parent, on_settings_changed: Optional[Callable[[Dict[str, Any]], None]] = None):
+    # Directory validation and change notification wait this long after typing (ms)
+    _DIR_VALIDATE_DELAY_MS = 300
+    
+    def __init__(self, parent, on_settings_changed: Optional[Callable[[Mapping[str, Any]], None]] = None):
         """
         Initialize settings panel.
         
         Args:
             parent: Parent widget
-            on_settings_changed: Callback function called when settings change
+            on_settings_changed: Callback function called when settings change,
+                with a read-only view of the current settings
         """
         super().__init__(parent)
         
@@ -47,6 +118,41 @@ class SettingsPanel(ctk.CTkFrame):
             "create_subdirs": False
         }
         
+        # Restore saved values, ignoring unknown keys and mismatched types
+        saved = _load_saved_settings(str(_SETTINGS_FILE))
+        for key, default in self.current_settings.items():
+            value = saved.get(key)
+            if isinstance(value, type(default)):
+                self.current_settings[key] = value
+        
+        # Read-only live view handed out instead of per-call copies
+        self._settings_view = MappingProxyType(self.current_settings)
+        
+        self._save_lock = threading.Lock()
+        self._save_seq = 0
+        self._saved_seq = 0
+        self._probe_seq = 0
+        self._dir_validate_after_id: Optional[str] = None
+        self._notify_job: Optional[str] = None
+        
+        # Last built DownloadConfig and the settings it was built from
+        self._config_cache: Optional[DownloadConfig] = None
+        self._config_cache_key: Optional[Tuple[str, str, str]] = None
+        
+        # Resolve theme tokens once; construction and directory status
+        # updates reuse them instead of querying the theme manager each time
+        self._fonts = {
+            name: theme_manager.get_font(name)
+            for name in ("body", "small", "subheading")
+        }
+        self._colors = {
+            name: theme_manager.get_color(name)
+            for name in (
+                "text_primary", "text_secondary", "secondary", "secondary_hover",
+                "success", "warning", "info", "error"
+            )
+        }
+        
         self._setup_ui()
         self._setup_bindings()
         self._validate_output_directory()
@@ -59,8 +165,8 @@ class SettingsPanel(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="Download Settings",
-            font=theme_manager.get_font("subheading"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._fonts["subheading"],
+            text_color=self._colors["text_primary"]
         )
         title_label.grid(row=0, column=0, columnspan=2, sticky="w", 
                         padx=12,
@@ -86,8 +192,8 @@ class SettingsPanel(ctk.CTkFrame):
         quality_label = ctk.CTkLabel(
             self,
             text="Video Quality",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._fonts["body"],
+            text_color=self._colors["text_primary"]
         )
         quality_label.grid(
             row=row, column=0,
@@ -95,43 +201,19 @@ class SettingsPanel(ctk.CTkFrame):
             pady=(6, 2)
         )
         
-        # Quality options
-        quality_frame = ctk.CTkFrame(self)
-        quality_frame.grid(
+        # Quality selector
+        self.quality_seg = ctk.CTkSegmentedButton(
+            self,
+            values=list(_QUALITY_MAPPING),
+            font=self._fonts["small"],
+            command=self._on_quality_changed
+        )
+        self.quality_seg.set(_QUALITY_LABELS.get(self.current_settings["quality"], ""))
+        self.quality_seg.grid(
             row=row + 1, column=0, columnspan=2,
             sticky="ew", padx=12,
             pady=(0, 4)
         )
-        quality_frame.grid_columnconfigure((0, 1, 2), weight=1)
-        
-        self.quality_var = tk.StringVar(value="best")
-        
-        quality_options = [
-            ("Best", "best"),
-            ("1080p", "1080p"),
-            ("720p", "720p"),
-            ("480p", "480p"),
-            ("360p", "360p"),
-            ("Worst", "worst")
-        ]
-        
-        for i, (text, value) in enumerate(quality_options):
-            col = i % 3
-            row_num = i // 3
-            
-            radio_btn = ctk.CTkRadioButton(
-                quality_frame,
-                text=text,
-                variable=self.quality_var,
-                value=value,
-                font=theme_manager.get_font("small"),
-                command=self._on_quality_changed
-            )
-            radio_btn.grid(
-                row=row_num, column=col,
-                sticky="w", padx=6,
-                pady=2
-            )
     
     def _create_format_section(self) -> None:
         """Create output format selection section."""
@@ -141,8 +223,8 @@ class SettingsPanel(ctk.CTkFrame):
         format_label = ctk.CTkLabel(
             self,
             text="Output Format",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._fonts["body"],
+            text_color=self._colors["text_primary"]
         )
         format_label.grid(
             row=row, column=0,
@@ -170,8 +252,8 @@ class SettingsPanel(ctk.CTkFrame):
         video_format_label = ctk.CTkLabel(
             video_format_frame,
             text="Video Format",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._fonts["small"],
+            text_color=self._colors["text_secondary"]
         )
         video_format_label.grid(row=0, column=0, sticky="w", padx=8)
         
@@ -180,9 +262,9 @@ class SettingsPanel(ctk.CTkFrame):
             values=["mp4", "webm", "mkv"],
             state="readonly",
             command=self._on_format_changed,
-            font=theme_manager.get_font("body")
+            font=self._fonts["body"]
         )
-        self.format_combo.set("mp4")
+        self.format_combo.set(self.current_settings["format"])
         self.format_combo.grid(
             row=1, column=0,
             sticky="ew", padx=8,
@@ -200,8 +282,8 @@ class SettingsPanel(ctk.CTkFrame):
         audio_format_label = ctk.CTkLabel(
             audio_format_frame,
             text="Audio Format",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._fonts["small"],
+            text_color=self._colors["text_secondary"]
         )
         audio_format_label.grid(row=0, column=0, sticky="w", padx=8)
         
@@ -210,9 +292,9 @@ class SettingsPanel(ctk.CTkFrame):
             values=["mp3", "aac", "m4a", "ogg"],
             state="readonly",
             command=self._on_audio_format_changed,
-            font=theme_manager.get_font("body")
+            font=self._fonts["body"]
         )
-        self.audio_format_combobox.set("mp3")
+        self.audio_format_combobox.set(self.current_settings["audio_format"])
         self.audio_format_combobox.grid(
             row=1, column=0,
             sticky="ew", padx=8,
@@ -227,8 +309,8 @@ class SettingsPanel(ctk.CTkFrame):
         output_label = ctk.CTkLabel(
             self,
             text="Output Directory",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
+            font=self._fonts["body"],
+            text_color=self._colors["text_primary"]
         )
         output_label.grid(
             row=row, column=0,
@@ -246,10 +328,11 @@ class SettingsPanel(ctk.CTkFrame):
         output_frame.grid_columnconfigure(0, weight=1)
         
         # Directory path display
+        self._output_var = tk.StringVar(value=self.current_settings["output_directory"])
         self.output_entry = ctk.CTkEntry(
             output_frame,
-            placeholder_text="Select output directory...",
-            font=theme_manager.get_font("body"),
+            textvariable=self._output_var,
+            font=self._fonts["body"],
             height=32
         )
         self.output_entry.grid(
@@ -257,7 +340,6 @@ class SettingsPanel(ctk.CTkFrame):
             sticky="ew", padx=8,
             pady=8
         )
-        self.output_entry.insert(0, self.current_settings["output_directory"])
         
         # Browse button
         self.browse_button = ctk.CTkButton(
@@ -265,7 +347,7 @@ class SettingsPanel(ctk.CTkFrame):
             text="📁 Browse",
             width=80,
             height=32,
-            font=theme_manager.get_font("small"),
+            font=self._fonts["small"],
             command=self._browse_directory
         )
         self.browse_button.grid(
@@ -280,10 +362,10 @@ class SettingsPanel(ctk.CTkFrame):
             text="📝 Create",
             width=80,
             height=32,
-            font=theme_manager.get_font("small"),
+            font=self._fonts["small"],
             command=self._create_output_directory,
-            fg_color=theme_manager.get_color("secondary"),
-            hover_color=theme_manager.get_color("secondary_hover")
+            fg_color=self._colors["secondary"],
+            hover_color=self._colors["secondary_hover"]
         )
         self.create_button.grid(
             row=0, column=2,
@@ -295,8 +377,8 @@ class SettingsPanel(ctk.CTkFrame):
         self.dir_status_label = ctk.CTkLabel(
             output_frame,
             text="",
-            font=theme_manager.get_font("small"),
-            text_color=theme_manager.get_color("text_secondary")
+            font=self._fonts["small"],
+            text_color=self._colors["text_secondary"]
         )
         self.dir_status_label.grid(
             row=1, column=0, columnspan=3,
@@ -305,37 +387,46 @@ class SettingsPanel(ctk.CTkFrame):
         )
     
     def _create_advanced_section(self) -> None:
-        """Create advanced options section."""
+        """Create advanced options section; its widgets are built on first expand."""
         row = 7
         
-        # Advanced options label
-        advanced_label = ctk.CTkLabel(
+        # Collapsible header
+        self.advanced_button = ctk.CTkButton(
             self,
-            text="Advanced Options",
-            font=theme_manager.get_font("body"),
-            text_color=theme_manager.get_color("text_primary")
-        )
-        advanced_label.grid(
+            text="Advanced Options ▸",
+            font=self._fonts["body"],
+            text_color=self._colors["text_primary"],
+            fg_color="transparent",
+            hover_color=self._colors["secondary_hover"],
+            anchor="w",
+            command=self._toggle_advanced
+        )
+        self.advanced_button.grid(
             row=row, column=0,
             sticky="w", padx=12,
-            pady=(8, 4)
+            pady=(8, 8)
         )
         
-        # Advanced options frame
-        advanced_frame = ctk.CTkFrame(self)
-        advanced_frame.grid(
-            row=row + 1, column=0, columnspan=2,
+        # The variable exists up front so set_settings works while collapsed
+        self.create_subdirs_var = tk.BooleanVar(value=self.current_settings["create_subdirs"])
+        self._advanced_built = False
+        self._advanced_visible = False
+    
+    def _build_advanced_content(self) -> None:
+        """Create the advanced options widgets."""
+        self.advanced_frame = ctk.CTkFrame(self)
+        self.advanced_frame.grid(
+            row=8, column=0, columnspan=2,
             sticky="ew", padx=12,
             pady=(0, 12)
         )
         
         # Create subdirectories checkbox
-        self.create_subdirs_var = tk.BooleanVar(value=self.current_settings["create_subdirs"])
         self.create_subdirs_checkbox = ctk.CTkCheckBox(
-            advanced_frame,
+            self.advanced_frame,
             text="Create subdirectories by channel",
             variable=self.create_subdirs_var,
-            font=theme_manager.get_font("small"),
+            font=self._fonts["small"],
             command=self._on_subdirs_changed
         )
         self.create_subdirs_checkbox.grid(
@@ -343,16 +434,31 @@ class SettingsPanel(ctk.CTkFrame):
             sticky="w", padx=8,
             pady=8
         )
+        
+        self._advanced_built = True
     
     def _setup_bindings(self) -> None:
         """Set up event bindings."""
-        # Bind output directory entry changes
-        self.output_entry.bind("<KeyRelease>", self._on_output_changed)
-        self.output_entry.bind("<FocusOut>", self._on_output_changed)
+        # Track output directory edits through the entry's variable
+        self._output_var.trace_add("write", self._on_output_changed)
+    
+    def _toggle_advanced(self) -> None:
+        """Expand or collapse advanced options, building them on first expand."""
+        self._advanced_visible = not self._advanced_visible
+        
+        if self._advanced_visible:
+            if self._advanced_built:
+                self.advanced_frame.grid()
+            else:
+                self._build_advanced_content()
+            self.advanced_button.configure(text="Advanced Options ▾")
+        else:
+            self.advanced_frame.grid_remove()
+            self.advanced_button.configure(text="Advanced Options ▸")
     
-    def _on_quality_changed(self) -> None:
+    def _on_quality_changed(self, value: str) -> None:
         """Handle quality selection change."""
-        self.current_settings["quality"] = self.quality_var.get()
+        self.current_settings["quality"] = _QUALITY_MAPPING[value]
         self._notify_change()
     
     def _on_format_changed(self, value: str) -> None:
@@ -365,13 +471,29 @@ class SettingsPanel(ctk.CTkFrame):
         self.current_settings["audio_format"] = value
         self._notify_change()
     
-    def _on_output_changed(self, event=None) -> None:
-        """Handle output directory path change."""
-        path = self.output_entry.get().strip()
-        if path != self.current_settings["output_directory"]:
-            self.current_settings["output_directory"] = path
-            self._validate_output_directory()
-            self._notify_change()
+    def _on_output_changed(self, *args) -> None:
+        """Handle output directory path change, validating once typing pauses."""
+        path = self._output_var.get().strip()
+        if path == self.current_settings["output_directory"]:
+            return
+        
+        self.current_settings["output_directory"] = path
+        self._cancel_dir_validation()
+        self._dir_validate_after_id = self.after(
+            self._DIR_VALIDATE_DELAY_MS, self._on_output_settled
+        )
+    
+    def _on_output_settled(self) -> None:
+        """Validate and announce the output directory after typing stops."""
+        self._dir_validate_after_id = None
+        self._validate_output_directory()
+        self._notify_change()
+    
+    def _cancel_dir_validation(self) -> None:
+        """Cancel a pending debounced directory validation, if any."""
+        if self._dir_validate_after_id is not None:
+            self.after_cancel(self._dir_validate_after_id)
+            self._dir_validate_after_id = None
     
     def _on_subdirs_changed(self) -> None:
         """Handle subdirectories option change."""
@@ -380,7 +502,7 @@ class SettingsPanel(ctk.CTkFrame):
     
     def _browse_directory(self) -> None:
         """Open directory browser."""
-        current_dir = self.output_entry.get().strip()
+        current_dir = self._output_var.get().strip()
         if not current_dir or not os.path.exists(current_dir):
             current_dir = str(Path.home())
         
@@ -390,13 +512,11 @@ class SettingsPanel(ctk.CTkFrame):
         )
         
         if selected_dir:
-            self.output_entry.delete(0, tk.END)
-            self.output_entry.insert(0, selected_dir)
-            self._on_output_changed()
+            self._output_var.set(selected_dir)
     
     def _create_output_directory(self) -> None:
         """Create the output directory if it doesn't exist."""
-        path = self.output_entry.get().strip()
+        path = self._output_var.get().strip()
         if not path:
             messagebox.showwarning("Invalid Path", "Please enter a directory path")
             return
@@ -409,51 +529,79 @@ class SettingsPanel(ctk.CTkFrame):
             messagebox.showerror("Error", f"Failed to create directory:\n{str(e)}")
     
     def _validate_output_directory(self) -> None:
-        """Validate the output directory."""
-        path = self.output_entry.get().strip()
+        """Validate the output directory without blocking on the filesystem."""
+        path = self._output_var.get().strip()
+        
+        # Only the latest probe may update the label
+        self._probe_seq += 1
         
         if not path:
-            self.dir_status_label.configure(
-                text="No directory specified",
-                text_color=theme_manager.get_color("warning")
-            )
+            self._apply_dir_status(self._probe_seq, ("No directory specified", "warning"))
             return
         
-        path_obj = Path(path)
+        threading.Thread(
+            target=self._probe_dir,
+            args=(self._probe_seq, path),
+            daemon=True
+        ).start()
+    
+    def _probe_dir(self, seq: int, path: str) -> None:
+        """Check the directory on a worker thread and post the result back."""
+        result = _probe_directory(path)
+        self.after(0, self._apply_dir_status, seq, result)
+    
+    def _apply_dir_status(self, seq: int, result: Tuple[str, str]) -> None:
+        """Show a probe result unless a newer probe has started."""
+        if seq != self._probe_seq:
+            return
         
-        if path_obj.exists() and path_obj.is_dir():
-            # Check write permissions
-            if os.access(path, os.W_OK):
-                self.dir_status_label.configure(
-                    text="✓ Directory exists and is writable",
-                    text_color=theme_manager.get_color("success")
-                )
-            else:
-                self.dir_status_label.configure(
-                    text="⚠ Directory exists but is not writable",
-                    text_color=theme_manager.get_color("warning")
-                )
-        else:
-            parent_dir = path_obj.parent
-            if parent_dir.exists() and os.access(parent_dir, os.W_OK):
-                self.dir_status_label.configure(
-                    text="📁 Directory will be created",
-                    text_color=theme_manager.get_color("info")
-                )
-            else:
-                self.dir_status_label.configure(
-                    text="✗ Invalid path or parent directory not accessible",
-                    text_color=theme_manager.get_color("error")
-                )
+        message, color = result
+        self.dir_status_label.configure(
+            text=message,
+            text_color=self._colors[color]
+        )
     
     def _notify_change(self) -> None:
-        """Notify parent of settings change."""
+        """Schedule one notification for all changes made before Tk is idle."""
+        if self._notify_job is None:
+            self._notify_job = self.after_idle(self._flush_notify)
+    
+    def _flush_notify(self) -> None:
+        """Notify parent of settings change and persist the new settings."""
+        self._notify_job = None
         if self.on_settings_changed:
-            self.on_settings_changed(self.current_settings.copy())
+            self.on_settings_changed(self._settings_view)
+        self._schedule_save()
+    
+    def _schedule_save(self) -> None:
+        """Persist current settings on a worker so the UI never waits on disk."""
+        self._save_seq += 1
+        _load_saved_settings.cache_clear()
+        threading.Thread(
+            target=self._persist_settings,
+            args=(self._save_seq, self.current_settings.copy()),
+            daemon=True
+        ).start()
     
-    def get_settings(self) -> Dict[str, Any]:
-        """Get current settings."""
-        return self.current_settings.copy()
+    def _persist_settings(self, seq: int, settings: Dict[str, Any]) -> None:
+        """Save a settings snapshot unless a newer one was already written."""
+        with self._save_lock:
+            if seq <= self._saved_seq:
+                return
+            self._saved_seq = seq
+            _save_settings(str(_SETTINGS_FILE), settings)
+    
+    def destroy(self) -> None:
+        """Cancel pending directory validation and notification and destroy the widget."""
+        self._cancel_dir_validation()
+        if self._notify_job is not None:
+            self.after_cancel(self._notify_job)
+            self._notify_job = None
+        super().destroy()
+    
+    def get_settings(self) -> Mapping[str, Any]:
+        """Get a read-only view of the current settings; copy it to keep a snapshot."""
+        return self._settings_view
     
     def set_settings(self, settings: Dict[str, Any]) -> None:
         """Set settings programmatically."""
@@ -462,7 +610,7 @@ class SettingsPanel(ctk.CTkFrame):
         
         # Update UI controls
         if "quality" in settings:
-            self.quality_var.set(settings["quality"])
+            self.quality_seg.set(_QUALITY_LABELS.get(settings["quality"], ""))
         
         if "format" in settings:
             self.format_combo.set(settings["format"])
@@ -471,17 +619,25 @@ class SettingsPanel(ctk.CTkFrame):
             self.audio_format_combobox.set(settings["audio_format"])
         
         if "output_directory" in settings:
-            self.output_entry.delete(0, tk.END)
-            self.output_entry.insert(0, settings["output_directory"])
+            self._output_var.set(settings["output_directory"])
             self._validate_output_directory()
         
         if "create_subdirs" in settings:
             self.create_subdirs_var.set(settings["create_subdirs"])
+        
+        self._schedule_save()
     
     def get_download_config(self) -> DownloadConfig:
         """Create DownloadConfig object from current settings."""
+        settings = self.current_settings
+        key = (settings["quality"], settings["format"], settings["output_directory"])
+        if key == self._config_cache_key:
+            return self._config_cache
+        
         config = DownloadConfig()
-        config.quality = self.current_settings["quality"]
-        config.format = self.current_settings["format"]
-        config.output_directory = self.current_settings["output_directory"]
+        config.quality = settings["quality"]
+        config.format = settings["format"]
+        config.output_directory = settings["output_directory"]
+        self._config_cache = config
+        self._config_cache_key = key
         return config 
\ No newline at end of file
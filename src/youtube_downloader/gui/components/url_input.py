@@ -8,13 +8,17 @@ real-time validation, visual feedback, and paste support.
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-from typing import Callable, Optional
-import threading
+from typing import Callable, Optional, Tuple
+from functools import lru_cache
 import re
 
 from ..styles.themes import theme_manager
 from ...core.validator import URLValidator
 
+# Every supported URL names one of these hosts; anything else is rejected
+# without running the validator
+_YT_HINT = re.compile(r'(?:youtube\.com|youtu\.be)', re.I)
+
 
 class URLInputPanel(ctk.CTkFrame):
     """
@@ -28,6 +32,11 @@ class URLInputPanel(ctk.CTkFrame):
     - Loading state indication
     """
     
+    # Validation runs once typing pauses for this long (ms)
+    _VALIDATE_DELAY_MS = 250
+    # Shorter input cannot be a YouTube URL and is rejected without a validator run
+    _MIN_URL_LENGTH = 10
+    
     def __init__(self, parent, on_url_changed: Optional[Callable[[str, bool], None]] = None):
         """
         Initialize URL input panel.
@@ -39,9 +48,21 @@ class URLInputPanel(ctk.CTkFrame):
         super().__init__(parent)
         
         self.validator = URLValidator()
+        
+        # Status colors and indicators, resolved once instead of per update
+        self._status_config = {
+            "": {"color": theme_manager.get_color("text_disabled"), "indicator": "●"},
+            "validating": {"color": theme_manager.get_color("info"), "indicator": "⟳"},
+            "valid": {"color": theme_manager.get_color("success"), "indicator": "✓"},
+            "invalid": {"color": theme_manager.get_color("error"), "indicator": "✗"},
+            "error": {"color": theme_manager.get_color("error"), "indicator": "⚠"}
+        }
         self.on_url_changed = on_url_changed
         self.current_url = ""
         self.is_valid = False
+        self._validate_after_id: Optional[str] = None
+        # Per-panel memo so retyped or re-pasted URLs skip the validator
+        self._cached_validate = lru_cache(maxsize=256)(self._validate_url)
         
         self._setup_ui()
         self._setup_bindings()
@@ -73,10 +94,11 @@ class URLInputPanel(ctk.CTkFrame):
         )
         self.input_frame.grid_columnconfigure(0, weight=1)
         
-        # URL entry
+        # URL entry; typing, pasting and set_url all report through the variable
+        self._url_var = tk.StringVar()
         self.url_entry = ctk.CTkEntry(
             self.input_frame,
-            placeholder_text="Paste YouTube video URL here...",
+            textvariable=self._url_var,
             height=32,
             font=theme_manager.get_font("body"),
             corner_radius=6
@@ -164,53 +186,72 @@ class URLInputPanel(ctk.CTkFrame):
     
     def _setup_bindings(self) -> None:
         """Set up event bindings."""
-        # Bind URL entry events
-        self.url_entry.bind("<KeyRelease>", self._on_url_changed)
-        self.url_entry.bind("<FocusOut>", self._on_url_changed)
-        self.url_entry.bind("<Control-v>", self._on_paste_event)
+        # Every edit to the entry, including paste, writes the variable
+        self._url_var.trace_add("write", self._on_url_changed)
         
         # Enable drag and drop (basic implementation)
         self.url_entry.bind("<Button-1>", lambda e: self.url_entry.focus_set())
     
-    def _on_url_changed(self, event=None) -> None:
-        """Handle URL input changes."""
-        url = self.url_entry.get().strip()
+    def _on_url_changed(self, *args) -> None:
+        """Handle URL input changes, validating once typing pauses."""
+        url = self._url_var.get().strip()
         
-        if url != self.current_url:
-            self.current_url = url
+        if url == self.current_url:
+            return
+        
+        self.current_url = url
+        self._cancel_scheduled_validation()
+        
+        if len(url) < self._MIN_URL_LENGTH:
             self._validate_url_async(url)
+        else:
+            self._validate_after_id = self.after(
+                self._VALIDATE_DELAY_MS, self._run_scheduled_validation, url
+            )
     
-    def _on_paste_event(self, event=None) -> None:
-        """Handle paste event."""
-        # Small delay to allow paste to complete
-        self.after(50, self._on_url_changed)
+    def _run_scheduled_validation(self, url: str) -> None:
+        """Run the validation scheduled by the last keystroke."""
+        self._validate_after_id = None
+        self._validate_url_async(url)
+    
+    def _cancel_scheduled_validation(self) -> None:
+        """Cancel a pending debounced validation, if any."""
+        if self._validate_after_id is not None:
+            self.after_cancel(self._validate_after_id)
+            self._validate_after_id = None
     
     def _validate_url_async(self, url: str) -> None:
-        """Validate URL asynchronously to avoid blocking UI."""
+        """Validate URL once Tk is idle, after the status has been drawn."""
         if not url:
             self._update_status("", False, "Enter a YouTube video URL to begin")
             return
         
+        if len(url) < self._MIN_URL_LENGTH or not _YT_HINT.search(url):
+            self._validation_complete(url, False, None)
+            return
+        
         # Show validating status
         self._update_status("validating", None, "Validating URL...")
         
-        # Perform validation in background thread
-        def validate():
-            try:
-                is_valid = self.validator.validate_youtube_url(url)
-                video_id = None
-                
-                if is_valid:
-                    video_id = self.validator.extract_video_id(url)
-                
-                # Update UI in main thread
-                self.after(0, lambda: self._validation_complete(url, is_valid, video_id))
-                
-            except Exception as e:
-                self.after(0, lambda: self._validation_error(str(e)))
+        # A cached regex match is too cheap to justify a thread
+        self.after_idle(self._validate_now, url)
+    
+    def _validate_now(self, url: str) -> None:
+        """Run validation on the Tk thread and report the result."""
+        try:
+            is_valid, video_id = self._cached_validate(url)
+        except Exception as e:
+            self._validation_error(str(e))
+            return
         
-        # Start validation thread
-        threading.Thread(target=validate, daemon=True).start()
+        self._validation_complete(url, is_valid, video_id)
+    
+    def _validate_url(self, url: str) -> Tuple[bool, Optional[str]]:
+        """Validate URL and extract its video ID with a single match."""
+        try:
+            return True, self.validator.extract_video_id(url)
+        except ValueError:
+            return False, None
     
     def _validation_complete(self, url: str, is_valid: bool, video_id: Optional[str]) -> None:
         """Handle validation completion."""
@@ -239,15 +280,7 @@ class URLInputPanel(ctk.CTkFrame):
     
     def _update_status(self, status_type: str, is_valid: Optional[bool], message: str) -> None:
         """Update status indicator and message."""
-        # Status colors and indicators
-        status_config = {
-            "": {"color": theme_manager.get_color("text_disabled"), "indicator": "●"},
-            "validating": {"color": theme_manager.get_color("info"), "indicator": "⟳"},
-            "valid": {"color": theme_manager.get_color("success"), "indicator": "✓"},
-            "invalid": {"color": theme_manager.get_color("error"), "indicator": "✗"},
-            "error": {"color": theme_manager.get_color("error"), "indicator": "⚠"}
-        }
-        
+        status_config = self._status_config
         config = status_config.get(status_type, status_config[""])
         
         # Update indicator
@@ -264,7 +297,7 @@ class URLInputPanel(ctk.CTkFrame):
         
         # Update entry border color if validation complete
         if is_valid is not None:
-            border_color = theme_manager.get_color("success") if is_valid else theme_manager.get_color("error")
+            border_color = status_config["valid" if is_valid else "invalid"]["color"]
             try:
                 self.url_entry.configure(border_color=border_color)
             except:
@@ -275,15 +308,14 @@ class URLInputPanel(ctk.CTkFrame):
         try:
             clipboard_text = self.clipboard_get().strip()
             if clipboard_text:
-                self.url_entry.delete(0, tk.END)
-                self.url_entry.insert(0, clipboard_text)
-                self._on_url_changed()
+                self._url_var.set(clipboard_text)
         except tk.TclError:
             messagebox.showwarning("Clipboard Error", "Could not access clipboard")
     
     def _clear_url(self) -> None:
         """Clear the URL input."""
-        self.url_entry.delete(0, tk.END)
+        self._url_var.set("")
+        self._cancel_scheduled_validation()
         self.current_url = ""
         self.is_valid = False
         self._update_status("", False, "Enter a YouTube video URL to begin")
@@ -301,9 +333,12 @@ class URLInputPanel(ctk.CTkFrame):
     
     def set_url(self, url: str) -> None:
         """Set URL programmatically."""
-        self.url_entry.delete(0, tk.END)
-        self.url_entry.insert(0, url)
-        self._on_url_changed()
+        self._url_var.set(url)
+    
+    def destroy(self) -> None:
+        """Cancel pending validation and destroy the widget."""
+        self._cancel_scheduled_validation()
+        super().destroy()
     
     def enable(self) -> None:
         """Enable the input panel."""
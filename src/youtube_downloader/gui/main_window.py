@@ -10,7 +10,7 @@ import tkinter as tk
 from tkinter import messagebox
 import threading
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
 import sys
 import os
 
@@ -309,9 +309,9 @@ class YouTubeDownloaderApp(ctk.CTk):
             else:
                 self.log_panel.add_log("WARNING", "Invalid YouTube URL format")
     
-    def _on_settings_changed(self, settings: Dict[str, Any]) -> None:
+    def _on_settings_changed(self, settings: Mapping[str, Any]) -> None:
         """Handle settings changes."""
-        self.log_panel.add_log("DEBUG", f"Settings updated: {settings}")
+        self.log_panel.add_log("DEBUG", f"Settings updated: {dict(settings)}")
     
     def _fetch_video_info(self) -> None:
         """Fetch video information in background thread."""
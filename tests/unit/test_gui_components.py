@@ -5,6 +5,7 @@ Tests the functionality of individual GUI components to ensure
 they work correctly and follow the expected behavior patterns.
 """
 
+import importlib
 import pytest
 import unittest
 from unittest.mock import Mock, patch, MagicMock
@@ -180,6 +181,68 @@ class TestGUIComponentMocks(unittest.TestCase):
             self.fail(f"Failed to import VideoInfoPanel: {e}")
 
 
+class TestBatchProgressVisibility(unittest.TestCase):
+    """Test batch progress redraws while the panel is hidden and shown."""
+    
+    def setUp(self):
+        """Build a bare panel on a plain base class, without Tk widgets."""
+        module_name = 'youtube_downloader.gui.components.batch_progress'
+        fake_ctk = MagicMock()
+        fake_ctk.CTkFrame = type('CTkFrame', (), {})
+        with patch.dict(sys.modules, {'customtkinter': fake_ctk}):
+            sys.modules.pop(module_name, None)
+            module = importlib.import_module(module_name)
+        
+        panel = module.BatchProgressPanel.__new__(module.BatchProgressPanel)
+        panel.download_items = []
+        panel._terminal_count = 0
+        panel._refresh_pending = True
+        panel._needs_refresh = False
+        panel._visible = False
+        panel.failed_videos = 0
+        panel._c_success = "#28a745"
+        panel._redraw_progress = Mock()
+        panel._cancel_clock = Mock()
+        panel._update_elapsed_time = Mock()
+        panel._set_if_changed = Mock()
+        panel.pause_resume_btn = Mock()
+        panel.cancel_btn = Mock()
+        panel.status_badge = Mock()
+        panel.current_video_label = Mock()
+        panel.speed_eta_label = Mock()
+        self.module = module
+        self.panel = panel
+    
+    def test_flush_while_hidden_redraws_on_map(self):
+        """Test a skipped refresh is drawn once the panel is shown again."""
+        self.panel._on_map()
+        self.panel._on_unmap()
+        
+        self.panel._flush_ui()
+        self.panel._redraw_progress.assert_not_called()
+        self.assertTrue(self.panel._needs_refresh)
+        
+        self.panel._on_map()
+        self.panel._redraw_progress.assert_called_once()
+        self.assertFalse(self.panel._needs_refresh)
+        
+        self.panel._flush_ui()
+        self.assertEqual(self.panel._redraw_progress.call_count, 2)
+    
+    def test_batch_complete_while_hidden_draws_final_state(self):
+        """Test completion draws the final state even if no <Map> follows."""
+        item = self.module.BatchDownloadItem("dQw4w9WgXcQ", "Title", "https://youtu.be/dQw4w9WgXcQ")
+        item.status = self.module.DownloadStatus.COMPLETED
+        self.panel.download_items = [item]
+        self.panel._terminal_count = 1
+        
+        self.panel._flush_ui()
+        
+        self.panel._redraw_progress.assert_called_once()
+        self.assertFalse(self.panel._needs_refresh)
+        self.panel.current_video_label.configure.assert_called_with(text="Batch download completed")
+
+
 class TestGUIIntegration(unittest.TestCase):
     """Test GUI component integration."""
     
@@ -8,6 +8,7 @@ import pytest
 import json
 import os
 from pathlib import Path
+from youtube_downloader.core import validator as validator_module
 from youtube_downloader.core.validator import URLValidator
 
 
@@ -89,4 +90,76 @@ class TestURLValidator:
             
         # Test normalization
         normalized = validator.normalize_url("https://www.youtube.com/shorts/FwYhFQHUn9g")
-        assert normalized == "https://www.youtube.com/watch?v=FwYhFQHUn9g" 
\ No newline at end of file
+        assert normalized == "https://www.youtube.com/watch?v=FwYhFQHUn9g"
+    
+    def test_module_level_functions(self, sample_urls):
+        """Test module-level functions match the URLValidator wrapper."""
+        for url in sample_urls["valid_urls"]:
+            assert validator_module.validate_youtube_url(url)
+        for url in sample_urls["invalid_urls"]:
+            assert not validator_module.validate_youtube_url(url)
+        for url, expected_id in sample_urls["video_ids"].items():
+            assert validator_module.extract_video_id(url) == expected_id
+        
+        assert validator_module.normalize_url("https://youtu.be/dQw4w9WgXcQ") == \
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        assert validator_module.is_valid_video_id("dQw4w9WgXcQ")
+        assert not validator_module.is_valid_video_id("short")
+    
+    def test_fast_reject_gate(self, validator):
+        """Test that short, oversized and non-YouTube strings are rejected early."""
+        assert not validator.validate_youtube_url("youtu.be/abc")
+        assert not validator.validate_youtube_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ&x=" + "a" * 2048)
+        assert not validator.validate_youtube_url("https://example.com/watch?v=dQw4w9WgXcQ")
+        assert validator.validate_youtube_url("HTTPS://YOUTU.BE/dQw4w9WgXcQ")
+        
+        with pytest.raises(ValueError, match="Invalid YouTube URL"):
+            validator.extract_video_id("youtu.be/abc")
+    
+    def test_adversarial_input_no_backtracking(self, validator):
+        """Test crafted inputs that pass the plausibility gate and reach the regex."""
+        adversarial_urls = [
+            "https://www.youtube.com/watch?v=" + "a" * 2000,
+            "https://www.youtube.com/watch?" + "&" * 2000,
+            "https://www.youtube.com/watch?" + "&v=" * 600,
+            "https://www.youtube.com/watch?" + "x=1&" * 500,
+            "https://www.youtube.com/watch/" + "/" * 2000,
+            "https://youtu.be/" + "a" * 2000,
+        ]
+        
+        for url in adversarial_urls:
+            assert validator_module._is_plausible_url(url)
+            assert not validator.validate_youtube_url(url)
+        
+        long_query = "https://www.youtube.com/watch?" + "x=1&" * 490 + "v=dQw4w9WgXcQ"
+        assert validator.extract_video_id(long_query) == "dQw4w9WgXcQ"
+    
+    def test_trailing_newline_from_paste(self, validator):
+        """Test that a pasted URL with a trailing newline is accepted like the original urlparse path."""
+        assert validator.extract_video_id("https://youtu.be/dQw4w9WgXcQ\n") == "dQw4w9WgXcQ"
+        assert validator.extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ\r\n") == "dQw4w9WgXcQ"
+        assert not validator.validate_youtube_url("https://youtu.be/dQw4w9WgXcQ ")
+    
+    def test_trailing_content_after_video_id(self, validator):
+        """Test that anchoring rejects video IDs with trailing garbage."""
+        assert not validator.validate_youtube_url("https://youtu.be/dQw4w9WgXcQextra")
+        assert not validator.validate_youtube_url("https://www.youtube.com/shorts/FwYhFQHUn9g/x")
+    
+    def test_uncommon_url_shapes(self, validator):
+        """Test URL shapes outside the fast regex keep their urlparse-based results."""
+        video_id = "dQw4w9WgXcQ"
+        accepted = [
+            "ftp://www.youtube.com/watch?v=" + video_id,
+            "//www.youtube.com/watch?v=" + video_id,
+            "https://www.youtube.com/watch?%76=" + video_id,
+            "https://www.youtube.com/watch?v=&v=" + video_id,
+        ]
+        for url in accepted:
+            assert validator.extract_video_id(url) == video_id, f"URL should be valid: {url}"
+        
+        # Only the first v parameter counts
+        assert not validator.validate_youtube_url("https://www.youtube.com/watch?v=bad&v=" + video_id)
+        assert not validator.validate_youtube_url("https://www.youtube.com/watch?%76=bad&v=" + video_id)
+        assert validator.extract_video_id(
+            "https://www.youtube.com/watch?v=" + video_id + "&v=aaaaaaaaaaa"
+        ) == video_id
@@ -303,6 +303,28 @@ class TestVideoFilter:
         
         assert len(filtered) == 0
 
+    def test_count_filtered_by_criteria(self):
+        """Test counting videos affected by each filter criteria."""
+        filter_config = FilterConfig(
+            min_duration=60,
+            max_duration=600,
+            min_view_count=10000,
+            min_upload_date="2024-01-08"
+        )
+        video_filter = VideoFilter(filter_config)
+        
+        counts = video_filter.count_filtered_by_criteria(self.create_sample_videos())
+        
+        assert counts == {
+            'total': 4,
+            'shorts': 1,
+            'live_streams': 1,
+            'duration_too_short': 2,
+            'duration_too_long': 1,
+            'view_count_too_low': 2,
+            'upload_date_too_old': 1
+        }
+
 
 class TestVideoFilterEdgeCases:
     """Test edge cases and error conditions for VideoFilter."""